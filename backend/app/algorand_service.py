@@ -3,19 +3,36 @@ Algorand blockchain integration service.
 Uses algokit-utils v4 and the generated typed client to interact with the EventTicketing contract.
 """
 
+import asyncio
 import logging
 import sys
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 
-from algosdk import mnemonic
+import httpx
+import orjson
+from algosdk import account, logic, mnemonic
+from algosdk.transaction import SuggestedParams
 from algosdk.v2client import algod, indexer
+from sqlalchemy import func, select
 
 import algokit_utils
 
-from app.config import settings
+from app.config import get_settings
+from app.database import async_session
+from app.models import Ticket
 
 logger = logging.getLogger(__name__)
 
+# Chain reads change at most once per round (~3.3s), so cache slightly below that
+CHAIN_READ_TTL = 3.0
+# Sends build txns as first_valid + 10 rounds from suggested params, so a cached
+# copy must stay within a couple of rounds of the chain tip
+SUGGESTED_PARAMS_TTL = 2.5
+
 # ─────────────────── Add contracts artifacts to path ─────────────────── #
 # So we can import the generated typed client
 _contracts_root = Path(__file__).parent.parent.parent / "projects" / "contracts"
@@ -29,6 +46,19 @@ from smart_contracts.artifacts.ticketing.event_ticketing_client import (  # noqa
 )
 
 
+@lru_cache(maxsize=4)
+def _load_spec(path_str: str, mtime: float) -> algokit_utils.Arc56Contract:
+    """Parse an ARC-56 spec once per (path, mtime); a rebuilt artifact gets a new mtime and is re-read."""
+    return algokit_utils.Arc56Contract.from_dict(orjson.loads(Path(path_str).read_bytes()))
+
+
+@lru_cache(maxsize=64)
+def _derive_account(mnemonic_phrase: str) -> tuple[str, str]:
+    """Derive (private_key, address) from a mnemonic with a single seed → key derivation."""
+    private_key = mnemonic.to_private_key(mnemonic_phrase)
+    return private_key, account.address_from_private_key(private_key)
+
+
 class AlgorandService:
     """
     Service layer for all Algorand interactions.
@@ -43,10 +73,22 @@ class AlgorandService:
         self._deployer_private_key: str | None = None
         self.app_id: int = 0
         self.app_client: EventTicketingClient | None = None
+        # Shared keep-alive client for raw algod REST reads
+        self._http: httpx.AsyncClient | None = None
+        # Dedicated pool for blocking SDK calls, so algod latency can't starve
+        # the default executor shared with the rest of the app
+        self._pool: ThreadPoolExecutor | None = None
+        # TTL cache for chain reads: key -> (expires_at, value), plus one lock per key
+        self._read_cache: dict[str, tuple[float, dict]] = {}
+        self._read_locks: dict[str, asyncio.Lock] = {}
+        # Last suggested params seeded into the AlgorandClient cache: (params, expires_at)
+        self._sp_cache: tuple[SuggestedParams, float] | None = None
+        self._sp_lock = asyncio.Lock()
 
     def initialize(self) -> None:
         """Initialize all Algorand clients. Call once at startup."""
         logger.info("Initializing Algorand service for Testnet...")
+        settings = get_settings()
 
         # 1. Algod client
         self.algod_client = algod.AlgodClient(
@@ -60,13 +102,24 @@ class AlgorandService:
             settings.indexer_server,
         )
 
+        # 2b. Pooled async HTTP client for algod REST reads
+        self._http = httpx.AsyncClient(
+            base_url=settings.algod_server,
+            headers={"X-Algo-API-Token": settings.algod_token},
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+
+        # 2c. Thread pool for blocking SDK calls
+        self._pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="algod")
+
         # 3. AlgorandClient (testnet)
         self.algorand = algokit_utils.AlgorandClient.testnet()
 
         # 4. Deployer account
         if settings.deployer_mnemonic:
-            self._deployer_private_key = mnemonic.to_private_key(settings.deployer_mnemonic)
-            self.deployer_address = mnemonic.to_public_key(settings.deployer_mnemonic)
+            self._deployer_private_key, self.deployer_address = _derive_account(settings.deployer_mnemonic)
             logger.info(f"Deployer: {self.deployer_address}")
         else:
             logger.warning("No DEPLOYER_MNEMONIC set — on-chain operations will fail.")
@@ -91,7 +144,7 @@ class AlgorandService:
             logger.error(f"ARC-56 spec not found: {arc56_path}")
             return
 
-        app_spec = algokit_utils.Arc56Contract.from_json(arc56_path.read_text())
+        app_spec = _load_spec(str(arc56_path), arc56_path.stat().st_mtime)
 
         # Create base AppClient
         base_client = self.algorand.client.get_app_client_by_id(
@@ -107,6 +160,45 @@ class AlgorandService:
         self.app_client = EventTicketingClient(base_client)
         logger.info("EventTicketing typed client initialized.")
 
+        # Warm suggested params so the first send skips /v2/transactions/params
+        try:
+            self._store_params(self.algorand.client.algod.suggested_params())
+        except Exception as e:
+            logger.warning(f"Could not prefetch suggested params: {e}")
+
+    def _store_params(self, params: SuggestedParams) -> None:
+        """Seed the AlgorandClient suggested-params cache, which every composer send reads from."""
+        expires_at = time.time() + SUGGESTED_PARAMS_TTL
+        self.algorand.set_suggested_params_cache(params, until=expires_at)
+        self._sp_cache = (params, expires_at)
+
+    async def _params(self) -> SuggestedParams:
+        """
+        Return fresh suggested params, refreshing the shared cache off the event loop.
+
+        Called before every send so the composer reads the cached copy instead of
+        hitting algod; concurrent sends share a single refresh.
+        """
+        if self._sp_cache and self._sp_cache[1] > time.time():
+            return self._sp_cache[0]
+        async with self._sp_lock:
+            if not self._sp_cache or self._sp_cache[1] <= time.time():
+                self._store_params(await self._run(self.algorand.client.algod.suggested_params))
+            return self._sp_cache[0]
+
+    async def close(self) -> None:
+        """Release pooled HTTP connections and SDK threads. Call once at shutdown."""
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+        if self._pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def _run(self, fn, *args, **kwargs):
+        """Run a blocking SDK call on the dedicated algod thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(self._pool, partial(fn, *args, **kwargs))
+
     async def mint_ticket_on_chain(
         self,
         ticket_price: int,
@@ -116,33 +208,59 @@ class AlgorandService:
         Mint a ticket NFT on the Algorand blockchain.
 
         Args:
-            ticket_price: Price in microAlgos (also sets max_resale_price)
+            ticket_price: Price in microAlgos (also the ticket's max resale price box)
             seat_number: Seat identifier (e.g., "VIP-1")
 
         Returns:
             dict with asa_id, txn_id, and app_address
         """
+        batch = await self.mint_tickets_batch(
+            [MintTicketArgs(ticket_price=ticket_price, seat_number=seat_number)]
+        )
+        return {
+            "asa_id": batch["asa_ids"][0],
+            "txn_id": batch["txn_ids"][0],
+            "app_address": batch["app_address"],
+        }
+
+    async def mint_tickets_batch(self, tickets: list[MintTicketArgs]) -> dict:
+        """
+        Mint several ticket NFTs in a single atomic transaction group.
+
+        One mint_ticket app call is appended per ticket and the group is
+        submitted once, so N tickets cost one round-trip and one block wait.
+
+        Args:
+            tickets: Mint arguments, one per seat (max 16 per group)
+
+        Returns:
+            dict with asa_ids and txn_ids (in input order), group_id, and app_address
+        """
         if not self.app_client:
             raise RuntimeError("App client not initialized. Set APP_ID and DEPLOYER_MNEMONIC in .env")
 
-        logger.info(f"Minting ticket: seat={seat_number}, price={ticket_price}")
+        logger.info(f"Minting {len(tickets)} ticket(s) in one group")
 
-        result = self.app_client.send.mint_ticket(
-            args=MintTicketArgs(
-                ticket_price=ticket_price,
-                seat_number=seat_number,
-            ),
+        # Each mint pays for its inner AssetConfig txn
+        params = algokit_utils.CommonAppCallParams(
+            extra_fee=algokit_utils.AlgoAmount.from_micro_algo(1_000)
         )
+        await self._params()
+        group = self.app_client.new_group()
+        for args in tickets:
+            group.mint_ticket(args=args, params=params)
+        result = await self._run(group.send)
 
-        asa_id = result.abi_return
-        txn_id = result.tx_ids[0] if result.tx_ids else None
+        asa_ids = [r.value for r in result.returns]
+        txn_ids = list(result.tx_ids)
 
-        logger.info(f"Minted ASA {asa_id} (txn: {txn_id})")
+        logger.info(f"Minted ASAs {asa_ids} (group: {result.group_id})")
 
         return {
-            "asa_id": asa_id,
-            "txn_id": txn_id,
-            "app_address": self.app_client._app_client.app_address,
+            "asa_ids": asa_ids,
+            "txn_ids": txn_ids,
+            "group_id": result.group_id,
+            "app_address": self.app_client.app_address,
         }
 
     async def transfer_ticket_on_chain(
@@ -165,7 +283,9 @@ class AlgorandService:
 
         # The transfer_ticket method expects a grouped payment transaction
         # For backend-mediated transfers, we compose the atomic group
-        result = self.app_client.send.transfer_ticket(
+        await self._params()
+        result = await self._run(
+            self.app_client.send.transfer_ticket,
             args=TransferTicketArgs(
                 payment=algokit_utils.PayParams(
                     sender=buyer_address,
@@ -181,18 +301,98 @@ class AlgorandService:
 
         return {"txn_id": txn_id}
 
-    def get_app_info(self) -> dict:
-        """Get current app info from the chain."""
-        if not self.algod_client or not self.app_id:
+    async def _cached_read(self, key: str, fetch: Callable[[], Awaitable[dict]]) -> dict:
+        """
+        Return a fresh cached value for `key`, or fetch it once.
+
+        Concurrent callers on a cold key wait on the same lock, so a burst
+        collapses into a single upstream request (single-flight).
+        """
+        entry = self._read_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        lock = self._read_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._read_cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+            value = await fetch()
+            self._read_cache[key] = (time.monotonic() + CHAIN_READ_TTL, value)
+            return value
+
+    async def _fetch_app_info(self) -> dict:
+        response = await self._http.get(f"/v2/applications/{self.app_id}")
+        response.raise_for_status()
+        return response.json()
+
+    async def get_app_info(self) -> dict:
+        """Get current app info from the chain (cached for CHAIN_READ_TTL seconds)."""
+        if not self._http or not self.app_id:
             return {"error": "Not configured"}
 
         try:
-            info = self.algod_client.application_info(self.app_id)
-            return info
+            return await self._cached_read(f"app:{self.app_id}", self._fetch_app_info)
         except Exception as e:
             logger.error(f"Failed to get app info: {e}")
             return {"error": str(e)}
 
 
-# Singleton instance
-algorand_service = AlgorandService()
+class MockAlgorandService(AlgorandService):
+    """
+    Drop-in stand-in used when CHAIN_MODE=mock.
+    Returns deterministic fake chain results immediately, without touching the network.
+
+    Fake ASA IDs continue from the highest one already stored, so a restart never
+    reissues an ID. The counter is per process; run mock mode with a single worker.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Next fake ASA ID; None until seeded from the DB on the first mint
+        self._next_asa_id: int | None = None
+        self._asa_lock = asyncio.Lock()
+
+    def initialize(self) -> None:
+        """Skip all network clients; only record the configured App ID."""
+        self.app_id = get_settings().app_id
+        logger.warning("CHAIN_MODE=mock — on-chain calls are simulated.")
+
+    @property
+    def _app_address(self) -> str:
+        return logic.get_application_address(self.app_id)
+
+    async def _reserve_asa_ids(self, count: int) -> list[int]:
+        """Hand out `count` consecutive fake ASA IDs above every stored ticket's."""
+        async with self._asa_lock:
+            if self._next_asa_id is None:
+                async with async_session() as session:
+                    self._next_asa_id = (await session.scalar(select(func.max(Ticket.asa_id))) or 0) + 1
+            first = self._next_asa_id
+            self._next_asa_id += count
+        return list(range(first, first + count))
+
+    async def mint_tickets_batch(self, tickets: list[MintTicketArgs]) -> dict:
+        asa_ids = await self._reserve_asa_ids(len(tickets))
+        return {
+            "asa_ids": asa_ids,
+            "txn_ids": [f"MOCKTX{asa_id:046d}" for asa_id in asa_ids],
+            "group_id": f"MOCKGROUP{asa_ids[0]:043d}" if asa_ids else None,
+            "app_address": self._app_address,
+        }
+
+    async def transfer_ticket_on_chain(self, asa_id: int, buyer_address: str, price: int) -> dict:
+        return {"txn_id": f"MOCKXFER{asa_id:044d}"}
+
+    async def get_app_info(self) -> dict:
+        return {"id": self.app_id, "params": {"creator": self._app_address}, "mock": True}
+
+
+def get_algorand_service() -> AlgorandService:
+    """The service for the configured CHAIN_MODE, created on first use rather than at import."""
+    return _service_for(get_settings().chain_mode)
+
+
+@lru_cache(maxsize=2)
+def _service_for(chain_mode: str) -> AlgorandService:
+    return MockAlgorandService() if chain_mode == "mock" else AlgorandService()
@@ -2,22 +2,35 @@
 Application configuration loaded from environment variables.
 """
 
-import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Literal
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 
-# Load .env from backend root
+# .env lives in the backend root
 _env_path = Path(__file__).parent.parent / ".env"
-load_dotenv(_env_path)
 
 
 class Settings(BaseSettings):
-    """App settings from environment variables."""
+    """App settings from environment variables (read-only once loaded)."""
+
+    # Env keys are UPPER_CASE, so matching stays case-insensitive.
+    # Unknown keys (e.g. VITE_APP_ID from a shared .env) are dropped, not stored.
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=False,
+        extra="ignore",
+        frozen=True,
+    )
 
     # Database
     database_url: str = "sqlite+aiosqlite:///./ticketing.db"
+    # Connection pool (Postgres only; SQLite runs in WAL mode with the default pool)
+    # Override with DB_POOL_SIZE / DB_MAX_OVERFLOW
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
 
     # Algorand
     algod_server: str = "https://testnet-api.algonode.cloud"
@@ -28,15 +41,26 @@ class Settings(BaseSettings):
     # App
     app_id: int = 0
     deployer_mnemonic: str = ""
+    # "mock" skips the network and fakes on-chain results (local dev, load tests)
+    chain_mode: Literal["live", "mock"] = "live"
 
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
-
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
-        extra = "allow"  # Allow extra fields like VITE_APP_ID
+    # Dev auto-reload; set RELOAD=false in production to run multiple workers
+    reload: bool = True
+    # Worker processes when reload is off (0 = one per CPU core)
+    workers: int = 0
+    # Run the chain subscriber inside the API process. `python -m app.main` turns this
+    # off for its workers and starts a single `python -m app.subscriber` instead.
+    run_subscriber: bool = True
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Load settings once, on first use rather than at import.
+    Tests can change the environment and call `get_settings.cache_clear()`.
+    """
+    load_dotenv(_env_path)
+    return Settings()
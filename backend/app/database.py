@@ -2,24 +2,81 @@
 Async SQLAlchemy database engine and session management.
 """
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import enum
+import logging
+import re
+import sqlite3
+from functools import lru_cache
+
+from sqlalchemy import SmallInteger, event, inspect, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.types import TypeDecorator
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Indexes earlier schemas created that no longer match any query; dropped on startup
+OBSOLETE_INDEXES = ("ix_events_created", "ix_tickets_event_status_minted", "ix_transfers_ticket_created")
+
+
+def get_engine() -> AsyncEngine:
+    """The engine for the configured DATABASE_URL, created on first use rather than at import."""
+    return _engine_for(get_settings().database_url)
+
+
+@lru_cache(maxsize=4)
+def _engine_for(database_url: str) -> AsyncEngine:
+    is_sqlite = database_url.startswith("sqlite")
+
+    # Routes rely on INSERT ... RETURNING, which SQLite added in 3.35
+    if is_sqlite and sqlite3.sqlite_version_info < (3, 35):
+        raise RuntimeError(f"SQLite >= 3.35 required for INSERT ... RETURNING (found {sqlite3.sqlite_version})")
 
-from app.config import settings
+    settings = get_settings()
+    engine = create_async_engine(
+        database_url,
+        echo=True,  # SQL logging — disable in production
+        future=True,
+        # Postgres: bounded pool sized for FastAPI concurrency; SQLite keeps the default pool
+        **(
+            {}
+            if is_sqlite
+            else {
+                "pool_size": settings.db_pool_size,
+                "max_overflow": settings.db_max_overflow,
+                "pool_pre_ping": True,
+            }
+        ),
+    )
+    if is_sqlite:
+        event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+    return engine
 
-# Create async engine
-engine = create_async_engine(
-    settings.database_url,
-    echo=True,  # SQL logging — disable in production
-    future=True,
-)
 
-# Session factory
-async_session = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """WAL lets readers run alongside the writer; NORMAL sync skips the fsync per commit."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    cursor.close()
+
+
+@lru_cache(maxsize=4)
+def _session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+
+def async_session() -> AsyncSession:
+    """Open a new session on the configured engine."""
+    return _session_factory(get_engine())()
 
 
 class Base(DeclarativeBase):
@@ -27,6 +84,35 @@ class Base(DeclarativeBase):
     pass
 
 
+class EnumCode(TypeDecorator):
+    """
+    Stores a Python enum as a SMALLINT code (its declaration index).
+
+    The API keeps using the enum's string values; only the on-disk form changes.
+    Codes are positional, so new members must be appended, never inserted.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[enum.Enum]) -> None:
+        super().__init__()
+        self.enum_class = enum_class
+        self._members = list(enum_class)
+        self._codes = {member: code for code, member in enumerate(self._members)}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self._codes[self.enum_class(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        # SQLite may hand back text for columns created before the switch
+        return self._members[int(value)]
+
+
 async def get_db() -> AsyncSession:
     """FastAPI dependency that yields a database session."""
     async with async_session() as session:
@@ -41,6 +127,144 @@ async def get_db() -> AsyncSession:
 
 
 async def init_db() -> None:
-    """Create all tables (call on startup)."""
-    async with engine.begin() as conn:
+    """Create all tables and any missing indexes (call on startup)."""
+    async with get_engine().begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # create_all skips tables that already exist, so add indexes introduced later
+        await conn.run_sync(_migrate_enum_columns)
+        await conn.run_sync(_migrate_server_defaults)
+        await conn.run_sync(_drop_obsolete_indexes)
+        await conn.run_sync(_dedupe_transfers)
+        await conn.run_sync(_create_missing_indexes)
+
+
+def _drop_obsolete_indexes(sync_conn) -> None:
+    """DROP INDEX IF EXISTS for indexes the models no longer declare."""
+    for name in OBSOLETE_INDEXES:
+        sync_conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+
+def _dedupe_transfers(sync_conn) -> None:
+    """
+    Older schemas let a re-delivered transfer be recorded twice. Keep the first row
+    per txn_id so the unique ix_transfers_txn_id can be built.
+    """
+    inspector = inspect(sync_conn)
+    if not inspector.has_table("transfers"):
+        return
+    if "ix_transfers_txn_id" in {ix["name"] for ix in inspector.get_indexes("transfers")}:
+        return
+    deleted = sync_conn.execute(text(
+        "DELETE FROM transfers WHERE txn_id IS NOT NULL AND id NOT IN "
+        "(SELECT min(id) FROM transfers WHERE txn_id IS NOT NULL GROUP BY txn_id)"
+    )).rowcount
+    if deleted:
+        logger.info(f"Removed {deleted} duplicate transfer row(s)")
+
+
+def _create_missing_indexes(sync_conn) -> None:
+    """
+    CREATE INDEX IF NOT EXISTS for every index declared on the models.
+
+    Older schemas may already cover a declared index with an inline UNIQUE
+    constraint (e.g. users.wallet_address); that index is skipped, and dropped
+    if an earlier startup created it alongside the constraint.
+    """
+    inspector = inspect(sync_conn)
+    for table in Base.metadata.sorted_tables:
+        constrained = {tuple(uc["column_names"]) for uc in inspector.get_unique_constraints(table.name)}
+        existing = {ix["name"] for ix in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.unique and tuple(column.name for column in index.columns) in constrained:
+                if index.name in existing:
+                    index.drop(sync_conn)
+                    logger.info(f"Dropped {index.name}: duplicates a UNIQUE constraint on {table.name}")
+                continue
+            if index.name not in existing:
+                index.create(sync_conn)
+
+
+def _migrate_enum_columns(sync_conn) -> None:
+    """Convert enum columns still holding member names (old VARCHAR schema) to EnumCode values."""
+    inspector = inspect(sync_conn)
+    dialect = sync_conn.dialect.name
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {col["name"]: col["type"] for col in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if not isinstance(column.type, EnumCode) or column.name not in existing:
+                continue
+            if isinstance(existing[column.name], SmallInteger):
+                continue
+
+            cases = " ".join(
+                f"WHEN '{member.name}' THEN {code}" for code, member in enumerate(column.type._members)
+            )
+            case_sql = f"CASE {{col}} {cases} END"
+            if dialect == "sqlite":
+                # SQLite columns are dynamically typed, so the declared type stays VARCHAR
+                # after the rewrite; only act while name-valued rows remain
+                pending = f"typeof({column.name}) = 'text' AND {column.name} NOT GLOB '[0-9]*'"
+                if sync_conn.execute(text(f"SELECT 1 FROM {table.name} WHERE {pending} LIMIT 1")).first() is None:
+                    continue
+                # Rewrite the values in place
+                sync_conn.execute(text(
+                    f"UPDATE {table.name} SET {column.name} = {case_sql.format(col=column.name)} WHERE {pending}"
+                ))
+            elif dialect == "postgresql":
+                sync_conn.execute(text(
+                    f"ALTER TABLE {table.name} ALTER COLUMN {column.name} DROP DEFAULT, "
+                    f"ALTER COLUMN {column.name} TYPE SMALLINT USING "
+                    f"{case_sql.format(col=column.name + '::text')}"
+                ))
+            else:
+                logger.warning(f"Cannot migrate {table.name}.{column.name} to SMALLINT on {dialect}")
+                continue
+            logger.info(f"Migrated {table.name}.{column.name} to SMALLINT enum codes")
+
+
+def _migrate_server_defaults(sync_conn) -> None:
+    """Add DB-side defaults to existing columns that older schemas filled in from Python."""
+    inspector = inspect(sync_conn)
+    dialect = sync_conn.dialect.name
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {col["name"]: col["default"] for col in inspector.get_columns(table.name)}
+        missing = [
+            column.name
+            for column in table.columns
+            if column.server_default is not None and column.name in existing and existing[column.name] is None
+        ]
+        if not missing:
+            continue
+
+        if dialect == "sqlite":
+            _rebuild_sqlite_table(sync_conn, table.name, missing)
+        elif dialect == "postgresql":
+            for name in missing:
+                sync_conn.execute(text(f"ALTER TABLE {table.name} ALTER COLUMN {name} SET DEFAULT now()"))
+        else:
+            logger.warning(f"Cannot add server defaults to {table.name} on {dialect}")
+            continue
+        logger.info(f"Added server defaults to {table.name}: {', '.join(missing)}")
+
+
+def _rebuild_sqlite_table(sync_conn, table_name: str, timestamp_columns: list[str]) -> None:
+    """
+    SQLite can't ALTER a column default, so copy the table into one whose DDL has
+    DEFAULT CURRENT_TIMESTAMP and swap it in. Indexes are dropped with the old
+    table and recreated by _create_missing_indexes.
+    """
+    ddl = sync_conn.execute(
+        text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": table_name}
+    ).scalar_one()
+    for name in timestamp_columns:
+        ddl = re.sub(rf"^(\s*\"?{name}\"?\s+DATETIME)", r"\1 DEFAULT (CURRENT_TIMESTAMP)", ddl, flags=re.M)
+    ddl = re.sub(rf"^CREATE TABLE \"?{table_name}\"?", f"CREATE TABLE _{table_name}_new", ddl)
+
+    sync_conn.execute(text(ddl))
+    sync_conn.execute(text(f"INSERT INTO _{table_name}_new SELECT * FROM {table_name}"))
+    sync_conn.execute(text(f"DROP TABLE {table_name}"))
+    sync_conn.execute(text(f"ALTER TABLE _{table_name}_new RENAME TO {table_name}"))
@@ -9,12 +9,13 @@ import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.database import init_db
 from app.routes import router
-from app.algorand_service import algorand_service
+from app.algorand_service import get_algorand_service
 from app.subscriber import chain_subscriber
-from app.config import settings
+from app.config import get_settings
 
 logging.basicConfig(
     level=logging.INFO,
@@ -30,6 +31,8 @@ _subscriber_task: asyncio.Task | None = None
 async def lifespan(app: FastAPI):
     """Startup and shutdown lifecycle."""
     global _subscriber_task
+    settings = get_settings()
+    algorand_service = get_algorand_service()
 
     # ── Startup ──
     logger.info("Starting EventTicketing Backend...")
@@ -41,10 +44,13 @@ async def lifespan(app: FastAPI):
     # 2. Initialize Algorand service
     algorand_service.initialize()
 
-    # 3. Start chain subscriber in background
-    chain_subscriber.initialize()
-    _subscriber_task = asyncio.create_task(chain_subscriber.start())
-    logger.info("Chain subscriber started in background.")
+    # 3. Start chain subscriber in background, unless it runs as its own process
+    if settings.run_subscriber:
+        chain_subscriber.initialize()
+        _subscriber_task = asyncio.create_task(chain_subscriber.start())
+        logger.info("Chain subscriber started in background.")
+    else:
+        logger.info("RUN_SUBSCRIBER=false — chain sync runs in a separate process.")
 
     logger.info(f"Backend ready → http://{settings.host}:{settings.port}")
     logger.info(f"Swagger docs → http://{settings.host}:{settings.port}/docs")
@@ -53,13 +59,15 @@ async def lifespan(app: FastAPI):
 
     # ── Shutdown ──
     logger.info("Shutting down...")
-    chain_subscriber.stop()
     if _subscriber_task:
+        chain_subscriber.stop()
         _subscriber_task.cancel()
         try:
             await _subscriber_task
         except asyncio.CancelledError:
             pass
+    await chain_subscriber.close()
+    await algorand_service.close()
     logger.info("Shutdown complete.")
 
 
@@ -72,6 +80,8 @@ app = FastAPI(
     ),
     version="0.1.0",
     lifespan=lifespan,
+    # orjson encodes datetimes/enums in C instead of via jsonable_encoder
+    default_response_class=ORJSONResponse,
 )
 
 # CORS — allow frontend
@@ -88,11 +98,40 @@ app.include_router(router, prefix="/api")
 
 
 if __name__ == "__main__":
+    import os
+    import subprocess
+    import sys
+
     import uvicorn
 
-    uvicorn.run(
-        "app.main:app",
-        host=settings.host,
-        port=settings.port,
-        reload=True,
-    )
+    settings = get_settings()
+    # uvicorn ignores workers under reload; mock ASA IDs are counted per process;
+    # otherwise scale across cores
+    workers = 1 if settings.reload or settings.chain_mode == "mock" else (settings.workers or os.cpu_count())
+
+    subscriber = None
+    if workers > 1:
+        # Migrate once up front rather than racing in every worker
+        asyncio.run(init_db())
+        if settings.run_subscriber:
+            # A subscriber per worker would apply every transfer once per worker:
+            # workers (spawned, so they re-read the environment) serve the API only
+            # and a single separate process syncs the chain
+            os.environ["RUN_SUBSCRIBER"] = "false"
+            subscriber = subprocess.Popen([sys.executable, "-m", "app.subscriber"])
+
+    try:
+        uvicorn.run(
+            "app.main:app",
+            host=settings.host,
+            port=settings.port,
+            reload=settings.reload,
+            workers=workers,
+            # libuv event loop + C HTTP parser (uvloop has no Windows build)
+            loop="asyncio" if sys.platform == "win32" else "uvloop",
+            http="httptools",
+        )
+    finally:
+        if subscriber:
+            subscriber.terminate()
+            subscriber.wait()
@@ -4,23 +4,25 @@ Maps to the schema defined in implementation_plan.md.
 """
 
 import enum
-from datetime import datetime, timezone
+from datetime import datetime
 
 from sqlalchemy import (
     BigInteger,
     DateTime,
-    Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    func,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, EnumCode
 
 
 # ─────────────────────── Enums ─────────────────────── #
+# Persisted as SMALLINT codes by declaration order (see EnumCode) — append new members only.
 
 class EventStatus(str, enum.Enum):
     DRAFT = "draft"
@@ -77,10 +79,10 @@ class Event(Base):
     organizer_wallet: Mapped[str] = mapped_column(String(58), nullable=False)
     app_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
     status: Mapped[EventStatus] = mapped_column(
-        Enum(EventStatus), default=EventStatus.DRAFT
+        EnumCode(EventStatus), default=EventStatus.DRAFT
     )
 
     # Relationships
@@ -89,6 +91,8 @@ class Event(Base):
 
 class Ticket(Base):
     __tablename__ = "tickets"
+    # Equality filters first, then the keyset column (lists page on id desc)
+    __table_args__ = (Index("ix_tickets_event_status_id", "event_id", "status", "id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     event_id: Mapped[int] = mapped_column(Integer, ForeignKey("events.id"), nullable=False)
@@ -96,11 +100,11 @@ class Ticket(Base):
     asa_id: Mapped[int] = mapped_column(BigInteger, unique=True, nullable=False)
     ticket_price: Mapped[int] = mapped_column(BigInteger, default=0)
     status: Mapped[TicketStatus] = mapped_column(
-        Enum(TicketStatus), default=TicketStatus.MINTED
+        EnumCode(TicketStatus), default=TicketStatus.MINTED, index=True
     )
     current_owner_wallet: Mapped[str] = mapped_column(String(58), nullable=False)
     minted_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
     txn_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
@@ -114,12 +118,12 @@ class User(Base):
     __tablename__ = "users"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    wallet_address: Mapped[str] = mapped_column(String(58), unique=True, nullable=False)
+    wallet_address: Mapped[str] = mapped_column(String(58), unique=True, index=True, nullable=False)
     display_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
     email: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    role: Mapped[UserRole] = mapped_column(Enum(UserRole), default=UserRole.BUYER)
+    role: Mapped[UserRole] = mapped_column(EnumCode(UserRole), default=UserRole.BUYER)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
 
     # Relationships
@@ -128,21 +132,23 @@ class User(Base):
 
 class Transfer(Base):
     __tablename__ = "transfers"
+    __table_args__ = (Index("ix_transfers_ticket_id_id", "ticket_id", "id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     ticket_id: Mapped[int] = mapped_column(Integer, ForeignKey("tickets.id"), nullable=False)
     from_wallet: Mapped[str] = mapped_column(String(58), nullable=False)
     to_wallet: Mapped[str] = mapped_column(String(58), nullable=False)
     price: Mapped[int] = mapped_column(BigInteger, default=0)
-    txn_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    # Unique so a re-delivered transfer_ticket call is recorded (and applied) once
+    txn_id: Mapped[str | None] = mapped_column(String(64), unique=True, index=True, nullable=True)
     transfer_type: Mapped[TransferType] = mapped_column(
-        Enum(TransferType), default=TransferType.PRIMARY_SALE
+        EnumCode(TransferType), default=TransferType.PRIMARY_SALE
     )
     status: Mapped[TransferStatus] = mapped_column(
-        Enum(TransferStatus), default=TransferStatus.PENDING
+        EnumCode(TransferStatus), default=TransferStatus.PENDING
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
 
     # Relationships
@@ -156,12 +162,21 @@ class Checkin(Base):
     ticket_id: Mapped[int] = mapped_column(Integer, ForeignKey("tickets.id"), nullable=False)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
     checked_in_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
     method: Mapped[CheckinMethod] = mapped_column(
-        Enum(CheckinMethod), default=CheckinMethod.QR_SCAN
+        EnumCode(CheckinMethod), default=CheckinMethod.QR_SCAN
     )
 
     # Relationships
     ticket: Mapped["Ticket"] = relationship(back_populates="checkin")
     user: Mapped["User"] = relationship(back_populates="checkins")
+
+
+class SubscriberState(Base):
+    """Last indexer round fully synced for an app, so restarts resume instead of rescanning."""
+
+    __tablename__ = "subscriber_state"
+
+    app_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=False)
+    watermark: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
@@ -5,35 +5,70 @@ FastAPI route handlers for the ticketing API.
 import logging
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import Select, bindparam, insert, lambda_stmt, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
-from app.database import get_db
+from app.database import async_session, get_db
 from app.models import Event, EventStatus, Ticket, TicketStatus, Transfer, TransferType, TransferStatus, User, UserRole
 from app.schemas import (
     EventCreate,
+    EventListAdapter,
     EventResponse,
     HealthResponse,
+    MintTicketBatchRequest,
     MintTicketRequest,
+    TicketListAdapter,
     TicketResponse,
+    TransferListAdapter,
     TransferResponse,
     TransferTicketRequest,
     UserCreate,
     UserResponse,
 )
-from app.algorand_service import algorand_service
-from app.config import settings
+from app.algorand_service import AlgorandService, MintTicketArgs, get_algorand_service
+from app.subscriber import chain_subscriber
+from app.config import Settings, get_settings
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Keyset pagination bounds for list endpoints
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+# Hot single-row lookups, compiled once and reused across requests (bind values via params)
+_event_by_id = lambda_stmt(lambda: select(Event).where(Event.id == bindparam("event_id")))
+_ticket_by_id = lambda_stmt(
+    lambda: select(Ticket).options(raiseload("*")).where(Ticket.id == bindparam("ticket_id"))
+)
+_ticket_by_asa = lambda_stmt(
+    lambda: select(Ticket).options(raiseload("*")).where(Ticket.asa_id == bindparam("asa_id"))
+)
+_user_by_wallet = lambda_stmt(lambda: select(User).where(User.wallet_address == bindparam("wallet_address")))
+
+
+def _json_list(adapter: TypeAdapter, rows) -> Response:
+    """
+    Validate ORM rows and encode them in one pass with a prebuilt adapter.
+    Returning a Response skips FastAPI's second per-item response_model validation.
+    """
+    items = adapter.validate_python(rows, from_attributes=True)
+    return Response(content=adapter.dump_json(items), media_type="application/json")
+
 
 # ─────────────────── Health ─────────────────── #
 
 @router.get("/health", response_model=HealthResponse, tags=["System"])
-async def health_check():
+async def health_check(settings: Settings = Depends(get_settings)):
     """Health check endpoint."""
     return HealthResponse(
         status="ok",
@@ -45,9 +80,14 @@ async def health_check():
 # ─────────────────── Events ─────────────────── #
 
 @router.post("/events", response_model=EventResponse, status_code=201, tags=["Events"])
-async def create_event(event: EventCreate, db: AsyncSession = Depends(get_db)):
+async def create_event(
+    event: EventCreate,
+    db: AsyncSession = Depends(get_db),
+    settings: Settings = Depends(get_settings),
+):
     """Create a new event."""
-    db_event = Event(
+    # INSERT ... RETURNING: one round trip, generated columns come back with the row
+    stmt = insert(Event).values(
         name=event.name,
         description=event.description,
         venue=event.venue,
@@ -57,24 +97,29 @@ async def create_event(event: EventCreate, db: AsyncSession = Depends(get_db)):
         organizer_wallet=event.organizer_wallet,
         app_id=settings.app_id,
         status=EventStatus.ACTIVE,
-    )
-    db.add(db_event)
-    await db.flush()
-    await db.refresh(db_event)
-    return db_event
+    ).returning(Event)
+    return (await db.execute(stmt)).scalar_one()
 
 
 @router.get("/events", response_model=list[EventResponse], tags=["Events"])
-async def list_events(db: AsyncSession = Depends(get_db)):
-    """List all events."""
-    result = await db.execute(select(Event).order_by(Event.created_at.desc()))
-    return result.scalars().all()
+async def list_events(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after_id: int | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """List events, newest first. Pass the last `id` seen as `after_id` for the next page."""
+    # EventResponse has no relationship fields; raiseload turns any accidental lazy load into an error
+    query = select(Event).options(raiseload("*")).order_by(Event.id.desc()).limit(limit)
+    if after_id:
+        query = query.where(Event.id < after_id)
+    result = await db.execute(query)
+    return _json_list(EventListAdapter, result.scalars().all())
 
 
 @router.get("/events/{event_id}", response_model=EventResponse, tags=["Events"])
 async def get_event(event_id: int, db: AsyncSession = Depends(get_db)):
     """Get a single event by ID."""
-    result = await db.execute(select(Event).where(Event.id == event_id))
+    result = await db.execute(_event_by_id, {"event_id": event_id})
     event = result.scalar_one_or_none()
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
@@ -84,13 +129,17 @@ async def get_event(event_id: int, db: AsyncSession = Depends(get_db)):
 # ─────────────────── Tickets ─────────────────── #
 
 @router.post("/tickets/mint", response_model=TicketResponse, status_code=201, tags=["Tickets"])
-async def mint_ticket(req: MintTicketRequest, db: AsyncSession = Depends(get_db)):
+async def mint_ticket(
+    req: MintTicketRequest,
+    db: AsyncSession = Depends(get_db),
+    algorand_service: AlgorandService = Depends(get_algorand_service),
+):
     """
     Mint a ticket NFT on-chain and store it in the database.
     This is the core endpoint: POST /tickets/mint -> on-chain ASA + DB row.
     """
     # 1. Verify event exists
-    result = await db.execute(select(Event).where(Event.id == req.event_id))
+    result = await db.execute(_event_by_id, {"event_id": req.event_id})
     event = result.scalar_one_or_none()
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
@@ -105,8 +154,8 @@ async def mint_ticket(req: MintTicketRequest, db: AsyncSession = Depends(get_db)
         logger.error(f"On-chain mint failed: {e}")
         raise HTTPException(status_code=502, detail=f"Blockchain error: {str(e)}")
 
-    # 3. Save to database
-    ticket = Ticket(
+    # 3. Save to database (INSERT ... RETURNING)
+    stmt = insert(Ticket).values(
         event_id=req.event_id,
         seat_number=req.seat_number,
         asa_id=chain_result["asa_id"],
@@ -114,38 +163,120 @@ async def mint_ticket(req: MintTicketRequest, db: AsyncSession = Depends(get_db)
         status=TicketStatus.MINTED,
         current_owner_wallet=chain_result["app_address"],
         txn_id=chain_result.get("txn_id"),
-    )
-    db.add(ticket)
-    await db.flush()
-    await db.refresh(ticket)
+    ).returning(Ticket)
+    ticket = (await db.execute(stmt)).scalar_one()
 
     logger.info(f"Ticket minted: id={ticket.id}, asa_id={ticket.asa_id}, seat={ticket.seat_number}")
     return ticket
 
 
-@router.get("/tickets", response_model=list[TicketResponse], tags=["Tickets"])
-async def list_tickets(
-    event_id: int | None = None,
-    status: str | None = None,
-    owner: str | None = None,
+@router.post("/tickets/mint_batch", response_model=list[TicketResponse], status_code=201, tags=["Tickets"])
+async def mint_ticket_batch(
+    req: MintTicketBatchRequest,
     db: AsyncSession = Depends(get_db),
+    algorand_service: AlgorandService = Depends(get_algorand_service),
 ):
-    """List tickets, optionally filtered by event_id, status, or owner wallet."""
-    query = select(Ticket).order_by(Ticket.minted_at.desc())
+    """
+    Mint several ticket NFTs for one event in a single atomic group.
+    One on-chain submission and one bulk INSERT, instead of one of each per seat.
+    """
+    # 1. Verify event exists
+    result = await db.execute(_event_by_id, {"event_id": req.event_id})
+    event = result.scalar_one_or_none()
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    # 2. Mint on-chain (one group for all seats)
+    try:
+        chain_result = await algorand_service.mint_tickets_batch(
+            [
+                MintTicketArgs(ticket_price=item.ticket_price, seat_number=item.seat_number)
+                for item in req.tickets
+            ]
+        )
+    except Exception as e:
+        logger.error(f"On-chain batch mint failed: {e}")
+        raise HTTPException(status_code=502, detail=f"Blockchain error: {str(e)}")
+
+    # 3. Save to database: one multi-row INSERT ... RETURNING; get_db commits once
+    rows = [
+        {
+            "event_id": req.event_id,
+            "seat_number": item.seat_number,
+            "asa_id": asa_id,
+            "ticket_price": item.ticket_price,
+            "status": TicketStatus.MINTED,
+            "current_owner_wallet": chain_result["app_address"],
+            "txn_id": txn_id,
+        }
+        for item, asa_id, txn_id in zip(req.tickets, chain_result["asa_ids"], chain_result["txn_ids"])
+    ]
+    # Unordered RETURNING lets SQLite batch into one statement; ids follow insertion order
+    result = await db.scalars(insert(Ticket).returning(Ticket), rows)
+    tickets = sorted(result.all(), key=lambda t: t.id)
+
+    logger.info(f"Batch minted {len(tickets)} ticket(s) for event {req.event_id} (group: {chain_result['group_id']})")
+    return tickets
+
+
+def _ticket_query(event_id: int | None, status: TicketStatus | None, owner: str | None) -> Select:
+    """Build the filtered, newest-first ticket query shared by the list and stream endpoints."""
+    query = select(Ticket).order_by(Ticket.id.desc())
     if event_id:
         query = query.where(Ticket.event_id == event_id)
     if status:
         query = query.where(Ticket.status == status)
     if owner:
         query = query.where(Ticket.current_owner_wallet == owner)
+    return query
+
+
+@router.get("/tickets", response_model=list[TicketResponse], tags=["Tickets"])
+async def list_tickets(
+    event_id: int | None = None,
+    status: TicketStatus | None = None,
+    owner: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after_id: int | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    List tickets, optionally filtered by event_id, status, or owner wallet.
+    Pass the last `id` seen as `after_id` for the next page.
+    """
+    query = _ticket_query(event_id, status, owner).limit(limit)
+    if after_id:
+        query = query.where(Ticket.id < after_id)
     result = await db.execute(query)
-    return result.scalars().all()
+    return _json_list(TicketListAdapter, result.scalars().all())
+
+
+@router.get("/tickets/stream", tags=["Tickets"])
+async def stream_tickets(
+    event_id: int | None = None,
+    status: TicketStatus | None = None,
+    owner: str | None = None,
+):
+    """
+    Stream every matching ticket as NDJSON (one TicketResponse per line).
+    Rows are fetched and encoded incrementally, so memory stays flat for large exports.
+    """
+    query = _ticket_query(event_id, status, owner)
+
+    async def rows():
+        # Own session: the request-scoped one may be closed before the body is sent
+        async with async_session() as session:
+            result = await session.stream_scalars(query)
+            async for ticket in result:
+                yield orjson.dumps(TicketResponse.model_validate(ticket).model_dump()) + b"\n"
+
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
 
 
 @router.get("/tickets/{ticket_id}", response_model=TicketResponse, tags=["Tickets"])
 async def get_ticket(ticket_id: int, db: AsyncSession = Depends(get_db)):
     """Get a single ticket by ID."""
-    result = await db.execute(select(Ticket).where(Ticket.id == ticket_id))
+    result = await db.execute(_ticket_by_id, {"ticket_id": ticket_id})
     ticket = result.scalar_one_or_none()
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
@@ -155,7 +286,7 @@ async def get_ticket(ticket_id: int, db: AsyncSession = Depends(get_db)):
 @router.get("/tickets/asa/{asa_id}", response_model=TicketResponse, tags=["Tickets"])
 async def get_ticket_by_asa(asa_id: int, db: AsyncSession = Depends(get_db)):
     """Get a ticket by its on-chain ASA ID."""
-    result = await db.execute(select(Ticket).where(Ticket.asa_id == asa_id))
+    result = await db.execute(_ticket_by_asa, {"asa_id": asa_id})
     ticket = result.scalar_one_or_none()
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found for ASA ID")
@@ -167,14 +298,21 @@ async def get_ticket_by_asa(asa_id: int, db: AsyncSession = Depends(get_db)):
 @router.get("/transfers", response_model=list[TransferResponse], tags=["Transfers"])
 async def list_transfers(
     ticket_id: int | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after_id: int | None = None,
     db: AsyncSession = Depends(get_db),
 ):
-    """List transfer history, optionally filtered by ticket_id."""
-    query = select(Transfer).order_by(Transfer.created_at.desc())
+    """
+    List transfer history, optionally filtered by ticket_id.
+    Pass the last `id` seen as `after_id` for the next page.
+    """
+    query = select(Transfer).order_by(Transfer.id.desc()).limit(limit)
     if ticket_id:
         query = query.where(Transfer.ticket_id == ticket_id)
+    if after_id:
+        query = query.where(Transfer.id < after_id)
     result = await db.execute(query)
-    return result.scalars().all()
+    return _json_list(TransferListAdapter, result.scalars().all())
 
 
 # ─────────────────── Users ─────────────────── #
@@ -182,31 +320,26 @@ async def list_transfers(
 @router.post("/users", response_model=UserResponse, status_code=201, tags=["Users"])
 async def create_or_get_user(user: UserCreate, db: AsyncSession = Depends(get_db)):
     """Register a user by wallet address (idempotent)."""
-    result = await db.execute(
-        select(User).where(User.wallet_address == user.wallet_address)
-    )
-    existing = result.scalar_one_or_none()
-    if existing:
-        return existing
-
-    db_user = User(
+    upsert = sqlite_insert if db.bind.dialect.name == "sqlite" else pg_insert
+    stmt = upsert(User).values(
         wallet_address=user.wallet_address,
         display_name=user.display_name,
         email=user.email,
         role=UserRole(user.role) if user.role else UserRole.BUYER,
     )
-    db.add(db_user)
-    await db.flush()
-    await db.refresh(db_user)
-    return db_user
+    # No-op update on conflict so RETURNING yields the existing row unchanged
+    # (DO NOTHING would return no row) — one round trip either way
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[User.wallet_address],
+        set_={"wallet_address": stmt.excluded.wallet_address},
+    ).returning(User)
+    return (await db.execute(stmt)).scalar_one()
 
 
 @router.get("/users/{wallet_address}", response_model=UserResponse, tags=["Users"])
 async def get_user(wallet_address: str, db: AsyncSession = Depends(get_db)):
     """Get user by wallet address."""
-    result = await db.execute(
-        select(User).where(User.wallet_address == wallet_address)
-    )
+    result = await db.execute(_user_by_wallet, {"wallet_address": wallet_address})
     user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -216,7 +349,16 @@ async def get_user(wallet_address: str, db: AsyncSession = Depends(get_db)):
 # ─────────────────── Chain State ─────────────────── #
 
 @router.get("/chain/app-info", tags=["Chain"])
-async def get_chain_app_info():
+async def get_chain_app_info(algorand_service: AlgorandService = Depends(get_algorand_service)):
     """Query the smart contract state directly from the blockchain."""
-    info = algorand_service.get_app_info()
+    info = await algorand_service.get_app_info()
     return info
+
+
+@router.get("/chain/sync/wait", tags=["Chain"])
+async def wait_for_chain_sync(timeout: float = Query(25.0, gt=0, le=60)):
+    """
+    Long-poll for synced ticket changes.
+    Returns as soon as the chain subscriber commits a mint or transfer, or after `timeout` seconds.
+    """
+    return {"changed": await chain_subscriber.wait_for_change(timeout)}
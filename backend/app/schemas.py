@@ -3,7 +3,7 @@ Pydantic schemas for API request/response validation.
 """
 
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 # ─────────────────── Events ─────────────────── #
@@ -31,7 +31,7 @@ class EventResponse(BaseModel):
     status: str
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ─────────────────── Tickets ─────────────────── #
@@ -42,6 +42,17 @@ class MintTicketRequest(BaseModel):
     ticket_price: int = Field(..., description="Price in microAlgos", examples=[1_000_000])
 
 
+class MintItem(BaseModel):
+    seat_number: str = Field(..., max_length=50, examples=["VIP-1"])
+    ticket_price: int = Field(..., description="Price in microAlgos", examples=[1_000_000])
+
+
+class MintTicketBatchRequest(BaseModel):
+    event_id: int
+    # Algorand atomic groups are capped at 16 transactions
+    tickets: list[MintItem] = Field(..., min_length=1, max_length=16)
+
+
 class TicketResponse(BaseModel):
     id: int
     event_id: int
@@ -53,7 +64,7 @@ class TicketResponse(BaseModel):
     minted_at: datetime
     txn_id: str | None
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TransferTicketRequest(BaseModel):
@@ -79,7 +90,7 @@ class UserResponse(BaseModel):
     role: str
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ─────────────────── Transfers ─────────────────── #
@@ -95,7 +106,15 @@ class TransferResponse(BaseModel):
     status: str
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
+
+
+# ─────────────────── List adapters ─────────────────── #
+# Built at import so list endpoints validate and serialize whole pages in one pydantic-core pass
+
+EventListAdapter = TypeAdapter(list[EventResponse])
+TicketListAdapter = TypeAdapter(list[TicketResponse])
+TransferListAdapter = TypeAdapter(list[TransferResponse])
 
 
 # ─────────────────── Health ─────────────────── #
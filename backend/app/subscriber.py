@@ -2,8 +2,11 @@
 Blockchain Sync Engine — watches the Algorand Testnet for EventTicketing contract events
 and syncs them to the local database.
 
-Uses polling against the Algorand Indexer since `algokit-subscriber` requires
-an async runtime. This runs as a background task inside the FastAPI event loop.
+Uses polling against the Algorand Indexer REST API (over a pooled keep-alive
+client) since `algokit-subscriber` requires its own runtime. This runs as a background task inside the FastAPI event loop,
+or on its own via `python -m app.subscriber` when the API runs several workers.
+The last synced round (watermark) is stored in `subscriber_state`, committed
+together with each batch, so a restart resumes instead of rescanning.
 
 Watches for:
   - mint_ticket ABI calls → INSERT into tickets table
@@ -13,22 +16,92 @@ Watches for:
 import asyncio
 import base64
 import logging
+import random
+import struct
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import NamedTuple
 
-from algosdk.v2client import indexer
-from sqlalchemy import select
+import httpx
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import settings
-from app.database import async_session
-from app.models import Ticket, TicketStatus, Transfer, TransferType, TransferStatus
+from app.config import get_settings
+from app.database import async_session, init_db
+from app.models import SubscriberState, Ticket, TicketStatus, Transfer, TransferType, TransferStatus
 
 logger = logging.getLogger(__name__)
 
 # ABI method selectors (first 4 bytes of SHA-512/256 of method signature)
 # mint_ticket(uint64,string)uint64 → 0x3311de72
 # transfer_ticket(pay,uint64)void  → 0xe5ff5d13
-MINT_SELECTOR = "3311de72"
-TRANSFER_SELECTOR = "e5ff5d13"
+MINT_SELECTOR = bytes.fromhex("3311de72")
+TRANSFER_SELECTOR = bytes.fromhex("e5ff5d13")
+
+# Indexer statuses worth retrying with backoff (rate limit / transient upstream failure)
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+SEARCH_ATTEMPTS = 6
+
+# ARC-4 return log: 0x151f7c75 prefix + big-endian uint64, unpacked in one call
+ARC4_RETURN_PREFIX = b"\x15\x1f\x7c\x75"
+_ARC4_UINT64_RETURN = struct.Struct(">4sQ")
+_UINT64 = struct.Struct(">Q")
+
+# Most recent synced ASA IDs kept in memory to skip re-delivered mints
+SEEN_ASA_CACHE_SIZE = 8192
+
+# How often wait_for_change re-reads the ticket tables when the subscriber runs in another process
+HIGH_WATER_POLL_INTERVAL = 1.0
+
+# Selector → ChainSubscriber parser method name
+_SELECTOR_HANDLERS = {
+    MINT_SELECTOR: "_parse_mint",
+    TRANSFER_SELECTOR: "_parse_transfer",
+}
+
+
+class ParsedTxn(NamedTuple):
+    """The fields of an indexer app-call txn the parsers need, read once."""
+
+    txn_id: str
+    sender: str
+    confirmed_round: int
+    app_args: Sequence[str]
+    inner_txns: Sequence[dict]
+    logs: Sequence[str]
+
+
+class TicketMeta(NamedTuple):
+    """Cached DB identity and current owner of a synced ticket."""
+
+    id: int
+    owner: str
+
+
+@dataclass
+class MintRecord:
+    """A mint_ticket call decoded from the indexer, ready to insert."""
+
+    txn_id: str
+    asa_id: int
+    seat_number: str
+    ticket_price: int
+    sender: str
+
+
+@dataclass
+class TransferRecord:
+    """A transfer_ticket call decoded from the indexer, ready to apply."""
+
+    txn_id: str
+    asa_id: int
+    buyer: str
+    price: int
 
 
 class ChainSubscriber:
@@ -38,227 +111,516 @@ class ChainSubscriber:
     """
 
     def __init__(self) -> None:
-        self.indexer_client: indexer.IndexerClient | None = None
+        # Pooled keep-alive client for indexer REST calls (algosdk's client opens a
+        # fresh connection, and TLS handshake, per request)
+        self._http: httpx.AsyncClient | None = None
         self.app_id: int = 0
         self._last_round: int = 0
         self._running: bool = False
-        self._poll_interval: int = 5  # seconds between polls
+        # Adaptive poll delay: drops to the floor while txns keep arriving,
+        # doubles on empty polls and quadruples after indexer errors
+        self._poll_min: float = 0.25
+        self._poll_max: float = 15.0
+        self._current_delay: float = self._poll_min
+        # Set when the indexer asked us to back off during the last poll
+        self._throttled: bool = False
+        # LRU of ASA IDs known to be in the DB (insertion order = recency).
+        # The value carries id + owner so transfers skip the ticket SELECT;
+        # None means stored but not yet looked up.
+        self._seen_asa: OrderedDict[int, TicketMeta | None] = OrderedDict()
+        # Pulsed (set, then cleared) after each commit that changed tickets,
+        # waking everyone blocked in wait_for_change()
+        self.tickets_changed = asyncio.Event()
 
     def initialize(self) -> None:
-        """Set up the indexer client."""
+        """Set up the pooled indexer HTTP client."""
+        settings = get_settings()
         self.app_id = settings.app_id
         if not self.app_id:
             logger.warning("Subscriber: No APP_ID configured — sync disabled.")
             return
 
-        self.indexer_client = indexer.IndexerClient(
-            settings.indexer_token,
-            settings.indexer_server,
+        self._http = httpx.AsyncClient(
+            base_url=settings.indexer_server,
+            headers={"X-Indexer-API-Token": settings.indexer_token} if settings.indexer_token else {},
+            timeout=30.0,
+            # Retries failed connects only; HTTP error statuses surface to the poll loop
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_keepalive_connections=8, max_connections=32),
+            ),
         )
         logger.info(f"Subscriber initialized for App ID {self.app_id}")
 
     async def start(self) -> None:
         """Start the polling loop (run as asyncio background task)."""
-        if not self.indexer_client or not self.app_id:
+        if not self._http or not self.app_id:
             logger.warning("Subscriber not configured — skipping.")
             return
 
         self._running = True
-        logger.info(f"Subscriber started — polling every {self._poll_interval}s")
+        try:
+            await self._load_watermark()
+        except Exception as e:
+            logger.warning(f"Could not load subscriber watermark: {e}")
+        try:
+            await self._seed_seen_asa()
+        except Exception as e:
+            logger.warning(f"Could not seed synced-ASA cache: {e}")
+        logger.info(f"Subscriber started — polling every {self._poll_min}s–{self._poll_max}s")
 
         while self._running:
             try:
-                await self._poll()
+                found = await self._poll()
+                if self._throttled:
+                    # Keep the delay raised by the retries instead of snapping back
+                    self._throttled = False
+                elif found:
+                    self._current_delay = self._poll_min
+                else:
+                    self._current_delay = min(self._poll_max, self._current_delay * 2)
             except Exception as e:
+                # Back off harder so a rate-limited or failing indexer isn't hammered
                 logger.error(f"Subscriber poll error: {e}", exc_info=True)
+                self._current_delay = min(self._poll_max, self._current_delay * 4)
+
+            await asyncio.sleep(self._current_delay + random.uniform(0, self._current_delay * 0.2))
 
-            await asyncio.sleep(self._poll_interval)
+    @staticmethod
+    async def _read_watermark(app_id: int) -> int | None:
+        async with async_session() as session:
+            return await session.scalar(select(SubscriberState.watermark).where(SubscriberState.app_id == app_id))
+
+    async def _load_watermark(self) -> None:
+        """Resume from the last round committed for this app, if any."""
+        watermark = await self._read_watermark(self.app_id)
+        if watermark:
+            self._last_round = watermark
+            logger.info(f"Subscriber resuming after round {watermark}")
+
+    async def _seed_seen_asa(self) -> None:
+        """Load the most recently stored tickets so repeat deliveries and transfers skip the DB."""
+        async with async_session() as session:
+            rows = (await session.execute(
+                select(Ticket.id, Ticket.asa_id, Ticket.current_owner_wallet)
+                .order_by(Ticket.id.desc())
+                .limit(SEEN_ASA_CACHE_SIZE)
+            )).all()
+        for ticket_id, asa_id, owner in reversed(rows):
+            self._seen_asa[asa_id] = TicketMeta(ticket_id, owner)
+
+    def _remember_asa(self, asa_id: int, meta: TicketMeta | None) -> None:
+        # Never downgrade a known owner to "unknown"
+        if meta is not None or self._seen_asa.get(asa_id) is None:
+            self._seen_asa[asa_id] = meta
+        self._seen_asa.move_to_end(asa_id)
+        if len(self._seen_asa) > SEEN_ASA_CACHE_SIZE:
+            self._seen_asa.popitem(last=False)
 
     def stop(self) -> None:
         """Stop the polling loop."""
         self._running = False
         logger.info("Subscriber stopped.")
 
-    async def _poll(self) -> None:
-        """Fetch new transactions for the app and process them."""
+    async def close(self) -> None:
+        """Release pooled indexer connections. Call once at shutdown."""
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+
+    async def wait_for_change(self, timeout: float) -> bool:
+        """Block until the next synced ticket change; False if `timeout` seconds pass first."""
+        if not self._running:
+            return await self._wait_for_high_water(timeout)
         try:
-            # Query indexer for app transactions since last round
-            search_params = {
-                "application_id": self.app_id,
-                "limit": 50,
-            }
-            if self._last_round > 0:
-                search_params["min_round"] = self._last_round + 1
+            await asyncio.wait_for(self.tickets_changed.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
 
-            response = self.indexer_client.search_transactions(**search_params)
+    @staticmethod
+    async def _read_high_water() -> tuple[int | None, int | None]:
+        async with async_session() as session:
+            return tuple((await session.execute(select(
+                select(func.max(Ticket.id)).scalar_subquery(), select(func.max(Transfer.id)).scalar_subquery()
+            ))).one())
+
+    async def _wait_for_high_water(self, timeout: float) -> bool:
+        """
+        wait_for_change for API workers whose subscriber runs in another process:
+        poll the highest ticket and transfer ids, which only move when a mint or
+        transfer is stored. (The watermark also advances on polls that find nothing.)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        start = await self._read_high_water()
+        while (remaining := deadline - loop.time()) > 0:
+            await asyncio.sleep(min(HIGH_WATER_POLL_INTERVAL, remaining))
+            if await self._read_high_water() != start:
+                return True
+        return False
+
+    async def _search_transactions(self, params: dict) -> dict:
+        """
+        GET /v2/transactions on the indexer, retrying 429/5xx with jittered exponential backoff.
+
+        A Retry-After header is honoured when present. Every retry also raises the
+        poll loop's delay, so a rate-limited subscriber keeps slowing down afterwards.
+        """
+        for attempt in range(SEARCH_ATTEMPTS):
+            response = await self._http.get("/v2/transactions", params=params)
+            if response.status_code not in RETRYABLE_STATUSES or attempt == SEARCH_ATTEMPTS - 1:
+                response.raise_for_status()
+                return response.json()
+
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                delay = float(retry_after)
+            else:
+                delay = min(30.0, 0.25 * 2**attempt) * (0.5 + random.random())
+            logger.warning(
+                f"Indexer returned {response.status_code}"
+                f"{f' (Retry-After: {retry_after})' if retry_after else ''}; retrying in {delay:.2f}s"
+            )
+            self._current_delay = min(self._poll_max, self._current_delay * 2)
+            self._throttled = True
+            await asyncio.sleep(delay)
+
+    async def _poll(self) -> bool:
+        """
+        Fetch new transactions for the app and sync them in one DB transaction.
+
+        Returns True if any transactions were found. Indexer errors propagate
+        so the loop in `start` can back off.
+        """
+        # Query indexer for app transactions since last round
+        search_params = {
+            "application-id": self.app_id,
+            # Only app calls; grouped payments and asset txns never reach us
+            "tx-type": "appl",
+            "limit": 1000,
+        }
+        if self._last_round > 0:
+            search_params["min-round"] = self._last_round + 1
+
+        records: list[MintRecord | TransferRecord] = []
+        max_round = self._last_round
+        seen = 0
+        # Hot per-txn loop: bind bound methods to locals once
+        process = self._process_transaction
+        append = records.append
+        # Drain every page via next-token, so a busy round can't spill past the limit
+        while True:
+            response = await self._search_transactions(search_params)
 
             transactions = response.get("transactions", [])
-            if not transactions:
-                return
-
-            logger.info(f"Subscriber: Processing {len(transactions)} transaction(s)")
-
+            seen += len(transactions)
             for txn in transactions:
-                await self._process_transaction(txn)
+                record = process(txn)
+                if record:
+                    append(record)
 
                 # Track the latest round
                 confirmed_round = txn.get("confirmed-round", 0)
-                if confirmed_round > self._last_round:
-                    self._last_round = confirmed_round
+                if confirmed_round > max_round:
+                    max_round = confirmed_round
 
-        except Exception as e:
-            logger.error(f"Indexer query failed: {e}")
+            next_token = response.get("next-token")
+            if not transactions or not next_token:
+                break
+            search_params["next"] = next_token
 
-    async def _process_transaction(self, txn: dict) -> None:
-        """Process a single transaction — detect mints and transfers."""
-        txn_type = txn.get("tx-type")
-        txn_id = txn.get("id", "")
+        if not seen:
+            return False
 
-        # We need application call transactions
-        if txn_type != "appl":
-            return
+        logger.info(f"Subscriber: Processing {seen} transaction(s)")
+
+        await self._apply(records, max_round)
+        # Only advance once every page is committed, so a failed write is retried
+        self._last_round = max_round
+        return True
 
-        app_call = txn.get("application-transaction", {})
-        app_args = app_call.get("application-args", [])
+    def _process_transaction(self, txn: dict) -> MintRecord | TransferRecord | None:
+        """Decode a single transaction into a mint or transfer record, if it is one."""
+        get = txn.get
+
+        # We need application call transactions
+        if get("tx-type") != "appl":
+            return None
 
+        app_call = get("application-transaction") or {}
+        app_args = app_call.get("application-args") or ()
         if not app_args:
-            return
+            return None
 
-        # Decode first arg (method selector)
+        # Decode first arg (method selector) and dispatch on its raw bytes
         try:
-            selector_bytes = base64.b64decode(app_args[0])
-            selector_hex = selector_bytes.hex()
+            parser = _SELECTOR_HANDLERS.get(base64.b64decode(app_args[0])[:4])
         except Exception:
-            return
+            return None
+        if not parser:
+            return None
+
+        parsed = ParsedTxn(
+            txn_id=get("id", ""),
+            sender=get("sender", ""),
+            confirmed_round=get("confirmed-round", 0),
+            app_args=app_args,
+            inner_txns=get("inner-txns") or (),
+            logs=get("logs") or (),
+        )
+        return getattr(self, parser)(parsed)
 
-        if selector_hex == MINT_SELECTOR:
-            await self._handle_mint(txn, txn_id)
-        elif selector_hex == TRANSFER_SELECTOR:
-            await self._handle_transfer(txn, txn_id)
+    def _parse_mint(self, txn: ParsedTxn) -> MintRecord | None:
+        """Decode a mint_ticket transaction."""
+        b64decode = base64.b64decode
+        unpack_uint64 = _UINT64.unpack_from
 
-    async def _handle_mint(self, txn: dict, txn_id: str) -> None:
-        """Handle a mint_ticket transaction — insert into tickets table."""
         # Extract the created ASA ID from inner transactions
-        inner_txns = txn.get("inner-txns", [])
         asa_id = None
-        for inner in inner_txns:
+        for inner in txn.inner_txns:
             if inner.get("tx-type") == "acfg":
                 asa_id = inner.get("created-asset-index") or inner.get("asset-config-transaction", {}).get("asset-id")
                 break
 
-        if asa_id is None:
+        if asa_id is None and txn.logs:
             # Also check the ABI return value in logs
-            logs = txn.get("logs", [])
-            if logs:
-                try:
-                    # ARC-4 return: first log entry, first 4 bytes = 0x151f7c75, rest = uint64
-                    last_log = base64.b64decode(logs[-1])
-                    if last_log[:4] == b"\x15\x1f\x7c\x75":
-                        asa_id = int.from_bytes(last_log[4:12], "big")
-                except Exception:
-                    pass
+            try:
+                prefix, value = _ARC4_UINT64_RETURN.unpack_from(b64decode(txn.logs[-1]))
+                if prefix == ARC4_RETURN_PREFIX:
+                    asa_id = value
+            except Exception:
+                pass
 
         if asa_id is None:
-            logger.warning(f"Mint txn {txn_id}: could not extract ASA ID")
-            return
+            logger.warning(f"Mint txn {txn.txn_id}: could not extract ASA ID")
+            return None
 
         # Extract ticket_price and seat_number from app args
-        app_call = txn.get("application-transaction", {})
-        app_args = app_call.get("application-args", [])
-
+        app_args = txn.app_args
         ticket_price = 0
         seat_number = "UNKNOWN"
         try:
             if len(app_args) > 1:
-                price_bytes = base64.b64decode(app_args[1])
-                ticket_price = int.from_bytes(price_bytes, "big")
+                ticket_price = unpack_uint64(b64decode(app_args[1]))[0]
             if len(app_args) > 2:
-                seat_bytes = base64.b64decode(app_args[2])
                 # ARC-4 string: first 2 bytes = length prefix, rest = utf-8
-                seat_number = seat_bytes[2:].decode("utf-8")
+                seat_number = b64decode(app_args[2])[2:].decode("utf-8")
         except Exception as e:
             logger.warning(f"Failed to decode mint args: {e}")
 
-        sender = txn.get("sender", "")
-        confirmed_round = txn.get("confirmed-round", 0)
-
-        async with async_session() as session:
-            # Check if already synced
-            existing = await session.execute(
-                select(Ticket).where(Ticket.asa_id == asa_id)
-            )
-            if existing.scalar_one_or_none():
-                logger.debug(f"ASA {asa_id} already in DB — skipping")
-                return
-
-            ticket = Ticket(
-                event_id=1,  # Default event — adjust as needed
-                seat_number=seat_number,
-                asa_id=asa_id,
-                ticket_price=ticket_price,
-                status=TicketStatus.MINTED,
-                current_owner_wallet=sender,
-                txn_id=txn_id,
-            )
-            session.add(ticket)
-            await session.commit()
-            logger.info(f"SYNCED MINT: ASA {asa_id} ({seat_number}) → DB ticket id={ticket.id}")
+        return MintRecord(
+            txn_id=txn.txn_id,
+            asa_id=asa_id,
+            seat_number=seat_number,
+            ticket_price=ticket_price,
+            sender=txn.sender,
+        )
 
-    async def _handle_transfer(self, txn: dict, txn_id: str) -> None:
-        """Handle a transfer_ticket transaction — update ownership in DB."""
+    def _parse_transfer(self, txn: ParsedTxn) -> TransferRecord | None:
+        """Decode a transfer_ticket transaction."""
         # Extract asset ID from app args
-        app_call = txn.get("application-transaction", {})
-        app_args = app_call.get("application-args", [])
-
         asa_id = None
         try:
-            if len(app_args) > 1:
-                asset_bytes = base64.b64decode(app_args[1])
-                asa_id = int.from_bytes(asset_bytes, "big")
+            if len(txn.app_args) > 1:
+                asa_id = _UINT64.unpack_from(base64.b64decode(txn.app_args[1]))[0]
         except Exception:
             pass
 
         if asa_id is None:
-            logger.warning(f"Transfer txn {txn_id}: could not extract ASA ID")
-            return
-
-        # The buyer is the Txn.sender (caller of transfer_ticket)
-        buyer = txn.get("sender", "")
-
-        # Extract payment amount from the grouped payment transaction
-        price = 0
-        group_id = txn.get("group")
-        # For grouped transactions, the payment is the previous txn in the group
-        # We can get the amount from inner-txns or the group
-
+            logger.warning(f"Transfer txn {txn.txn_id}: could not extract ASA ID")
+            return None
+
+        # The buyer is the Txn.sender (caller of transfer_ticket).
+        # The payment is the previous txn in the group; its amount isn't read yet.
+        return TransferRecord(txn_id=txn.txn_id, asa_id=asa_id, buyer=txn.sender, price=0)
+
+    async def _apply(self, records: list[MintRecord | TransferRecord], watermark: int) -> None:
+        """
+        Write a poll's worth of records and the new watermark in one session and one commit.
+
+        The records go in together through _write_records. If that fails (a
+        row the database rejects), it is rolled back to a savepoint and the
+        records are retried one savepoint each, so the bad one is logged and
+        skipped while the rest of the batch and the watermark still commit.
+        A rejected txn is never retried: the watermark moves past it.
+        """
+        changed = False
+        # asa_id -> meta to write back into the cache once the commit succeeds
+        known: dict[int, TicketMeta | None] = {}
         async with async_session() as session:
-            result = await session.execute(
-                select(Ticket).where(Ticket.asa_id == asa_id)
-            )
-            ticket = result.scalar_one_or_none()
-            if not ticket:
-                logger.warning(f"Transfer ASA {asa_id}: ticket not found in DB")
-                return
-
-            # Record transfer
-            transfer = Transfer(
-                ticket_id=ticket.id,
-                from_wallet=ticket.current_owner_wallet,
-                to_wallet=buyer,
-                price=price,
-                txn_id=txn_id,
-                transfer_type=TransferType.RESALE,
-                status=TransferStatus.CONFIRMED,
-            )
-            session.add(transfer)
-
-            # Update ownership
-            ticket.current_owner_wallet = buyer
-            ticket.status = TicketStatus.TRANSFERRED
+            try:
+                async with session.begin_nested():
+                    changed = await self._write_records(session, records, known)
+            except DBAPIError as e:
+                logger.warning(f"Batch of {len(records)} records rejected ({e.orig}) — retrying one by one")
+                known.clear()
+                # Mints first, then transfers in chain order, as in the batch
+                ordered = [r for r in records if isinstance(r, MintRecord)]
+                ordered += [r for r in records if isinstance(r, TransferRecord)]
+                for record in ordered:
+                    staged = dict(known)
+                    try:
+                        async with session.begin_nested():
+                            changed |= await self._write_records(session, [record], staged)
+                    except DBAPIError as e:
+                        logger.error(f"Skipping txn {record.txn_id} (ASA {record.asa_id}): {e.orig}")
+                        continue
+                    known = staged
+
+            # Watermark commits atomically with the rows it covers
+            insert = sqlite_insert if session.bind.dialect.name == "sqlite" else pg_insert
+            stmt = insert(SubscriberState).values(app_id=self.app_id, watermark=watermark)
+            await session.execute(stmt.on_conflict_do_update(
+                index_elements=[SubscriberState.app_id],
+                set_={"watermark": stmt.excluded.watermark},
+            ))
 
             await session.commit()
-            logger.info(f"SYNCED TRANSFER: ASA {asa_id} → {buyer}")
+
+        # Every mint is now in the DB, whether inserted here or earlier
+        for asa_id, meta in known.items():
+            self._remember_asa(asa_id, meta)
+
+        if changed:
+            self.tickets_changed.set()
+            self.tickets_changed.clear()
+
+    async def _write_records(
+        self,
+        session: AsyncSession,
+        records: Sequence[MintRecord | TransferRecord],
+        known: dict[int, TicketMeta | None],
+    ) -> bool:
+        """
+        Insert `records` into the open session; True if any ticket changed.
+
+        Mints go in as one INSERT ... ON CONFLICT DO NOTHING. Transfers take
+        the ticket id and previous owner from `known`, then the cache (one
+        IN (...) query for misses only), and go in the same way, keyed on
+        txn_id; ownership changes for the rows actually inserted go out as
+        one executemany UPDATE by primary key. Mints are inserted first, then
+        transfers applied in chain order, so a ticket minted and resold within
+        the same batch chains correctly. The resulting owners land in `known`.
+        """
+        insert = sqlite_insert if session.bind.dialect.name == "sqlite" else pg_insert
+        # Mints already known to be stored are dropped without touching the DB
+        mints = [r for r in records if isinstance(r, MintRecord) and r.asa_id not in self._seen_asa]
+        transfers = [r for r in records if isinstance(r, TransferRecord)]
+
+        changed = False
+        if mints:
+            # One multi-row INSERT; the unique asa_id index drops already-synced mints
+            minted = TicketStatus.MINTED
+            stmt = insert(Ticket).on_conflict_do_nothing(index_elements=[Ticket.asa_id])
+            inserted = {
+                asa_id: ticket_id
+                for ticket_id, asa_id in (await session.execute(
+                    stmt.returning(Ticket.id, Ticket.asa_id),
+                    [
+                        {
+                            "event_id": 1,  # Default event — adjust as needed
+                            "seat_number": mint.seat_number,
+                            "asa_id": mint.asa_id,
+                            "ticket_price": mint.ticket_price,
+                            "status": minted,
+                            "current_owner_wallet": mint.sender,
+                            "txn_id": mint.txn_id,
+                        }
+                        for mint in mints
+                    ],
+                )).all()
+            }
+            changed = bool(inserted)
+            for mint in mints:
+                if mint.asa_id in inserted:
+                    known[mint.asa_id] = TicketMeta(inserted[mint.asa_id], mint.sender)
+                    logger.info(f"SYNCED MINT: ASA {mint.asa_id} ({mint.seat_number})")
+                else:
+                    known.setdefault(mint.asa_id, None)
+                    logger.debug(f"ASA {mint.asa_id} already in DB — skipping")
+
+        if transfers:
+            owners: dict[int, TicketMeta] = {}
+            for transfer in transfers:
+                meta = known.get(transfer.asa_id) or self._seen_asa.get(transfer.asa_id)
+                if meta:
+                    owners[transfer.asa_id] = meta
+            misses = {t.asa_id for t in transfers} - owners.keys()
+            if misses:
+                for ticket_id, asa_id, owner in (await session.execute(
+                    select(Ticket.id, Ticket.asa_id, Ticket.current_owner_wallet)
+                    .where(Ticket.asa_id.in_(misses))
+                )).all():
+                    owners[asa_id] = TicketMeta(ticket_id, owner)
+
+            # Walk the transfers in chain order so each row records the owner it moved from
+            rows: list[tuple[int, dict]] = []  # (asa_id, transfer row)
+            last_txn: dict[int, str] = {}  # ticket id -> its latest transfer in this batch
+            batch_txns: set[str] = set()
+            for transfer in transfers:
+                meta = owners.get(transfer.asa_id)
+                if not meta:
+                    logger.warning(f"Transfer ASA {transfer.asa_id}: ticket not found in DB")
+                    continue
+                if transfer.txn_id in batch_txns:
+                    continue
+                batch_txns.add(transfer.txn_id)
+                rows.append((transfer.asa_id, {
+                    "ticket_id": meta.id,
+                    "from_wallet": meta.owner,
+                    "to_wallet": transfer.buyer,
+                    "price": transfer.price,
+                    "txn_id": transfer.txn_id,
+                    "transfer_type": TransferType.RESALE,
+                    "status": TransferStatus.CONFIRMED,
+                }))
+                owners[transfer.asa_id] = known[transfer.asa_id] = TicketMeta(meta.id, transfer.buyer)
+                last_txn[meta.id] = transfer.txn_id
+
+            if rows:
+                # The unique txn_id index drops transfers recorded by an earlier delivery
+                stmt = insert(Transfer).on_conflict_do_nothing(index_elements=[Transfer.txn_id])
+                recorded = set((await session.scalars(
+                    stmt.returning(Transfer.txn_id), [row for _, row in rows]
+                )).all())
+                for asa_id, row in rows:
+                    if row["txn_id"] in recorded:
+                        logger.info(f"SYNCED TRANSFER: ASA {asa_id} → {row['to_wallet']}")
+                    else:
+                        logger.debug(f"Transfer {row['txn_id']} already in DB — skipping")
+
+                # Update ownership — final owner per ticket, one executemany. A ticket whose
+                # latest transfer was already recorded already has that owner (or a later one).
+                moved = [meta for meta in owners.values() if last_txn.get(meta.id) in recorded]
+                if moved:
+                    changed = True
+                    await session.execute(update(Ticket), [
+                        {"id": meta.id, "current_owner_wallet": meta.owner, "status": TicketStatus.TRANSFERRED}
+                        for meta in moved
+                    ])
+
+        return changed
 
 
 # Singleton
 chain_subscriber = ChainSubscriber()
+
+
+async def run() -> None:
+    """Sync the chain in a process of its own, outside the API workers."""
+    await init_db()
+    chain_subscriber.initialize()
+    try:
+        await chain_subscriber.start()
+    finally:
+        await chain_subscriber.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)-8s [%(name)s] %(message)s",
+    )
+    asyncio.run(run())
@@ -0,0 +1,46 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import algorand_service, database
+from app.config import get_settings
+from app.database import init_db
+from app.main import app
+
+
+@pytest.fixture(autouse=True)
+def settings_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Point every test at its own SQLite file, with the chain mocked and the subscriber off."""
+    db_path = tmp_path / "ticketing.db"
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{db_path}")
+    monkeypatch.setenv("CHAIN_MODE", "mock")
+    monkeypatch.setenv("APP_ID", "0")
+    get_settings.cache_clear()
+    yield db_path
+    get_settings.cache_clear()
+    database._engine_for.cache_clear()
+    algorand_service._service_for.cache_clear()
+
+
+@pytest.fixture
+async def db() -> None:
+    """Create the schema for tests that talk to the database directly."""
+    await init_db()
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient]:
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def event_id(client: TestClient) -> int:
+    response = client.post(
+        "/api/events",
+        json={"name": "Launch", "max_resale_price": 1_000, "organizer_wallet": "ORGANIZER"},
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
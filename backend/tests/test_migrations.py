@@ -0,0 +1,148 @@
+import logging
+import sqlite3
+from pathlib import Path
+
+from app.database import init_db
+from app.models import EventStatus, TransferType
+
+# Schema and rows as the first release created them: enums stored by member name,
+# timestamps filled in from Python, inline UNIQUE constraints and no secondary indexes
+BASELINE_SCHEMA = """
+CREATE TABLE events (
+    id INTEGER NOT NULL,
+    name VARCHAR(255) NOT NULL,
+    description TEXT,
+    venue VARCHAR(255),
+    event_date DATETIME,
+    total_seats INTEGER NOT NULL,
+    max_resale_price BIGINT NOT NULL,
+    organizer_wallet VARCHAR(58) NOT NULL,
+    app_id BIGINT NOT NULL,
+    created_at DATETIME NOT NULL,
+    status VARCHAR(9) NOT NULL,
+    PRIMARY KEY (id)
+);
+CREATE TABLE users (
+    id INTEGER NOT NULL,
+    wallet_address VARCHAR(58) NOT NULL,
+    display_name VARCHAR(100),
+    email VARCHAR(255),
+    role VARCHAR(9) NOT NULL,
+    created_at DATETIME NOT NULL,
+    PRIMARY KEY (id),
+    UNIQUE (wallet_address)
+);
+CREATE TABLE tickets (
+    id INTEGER NOT NULL,
+    event_id INTEGER NOT NULL,
+    seat_number VARCHAR(50) NOT NULL,
+    asa_id BIGINT NOT NULL,
+    ticket_price BIGINT NOT NULL,
+    status VARCHAR(11) NOT NULL,
+    current_owner_wallet VARCHAR(58) NOT NULL,
+    minted_at DATETIME NOT NULL,
+    txn_id VARCHAR(64),
+    PRIMARY KEY (id),
+    FOREIGN KEY(event_id) REFERENCES events (id),
+    UNIQUE (asa_id)
+);
+CREATE TABLE transfers (
+    id INTEGER NOT NULL,
+    ticket_id INTEGER NOT NULL,
+    from_wallet VARCHAR(58) NOT NULL,
+    to_wallet VARCHAR(58) NOT NULL,
+    price BIGINT NOT NULL,
+    txn_id VARCHAR(64),
+    transfer_type VARCHAR(12) NOT NULL,
+    status VARCHAR(9) NOT NULL,
+    created_at DATETIME NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY(ticket_id) REFERENCES tickets (id)
+);
+CREATE TABLE checkins (
+    id INTEGER NOT NULL,
+    ticket_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    checked_in_at DATETIME NOT NULL,
+    method VARCHAR(7) NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY(ticket_id) REFERENCES tickets (id),
+    FOREIGN KEY(user_id) REFERENCES users (id)
+);
+INSERT INTO events VALUES (1, 'Launch', NULL, NULL, NULL, 10, 500, 'ORGANIZER', 1, '2025-01-01 00:00:00', 'ACTIVE');
+INSERT INTO users VALUES (1, 'FAN', NULL, NULL, 'ORGANIZER', '2025-01-01 00:00:00');
+INSERT INTO tickets VALUES (1, 1, 'A1', 501, 100, 'TRANSFERRED', 'BOB', '2025-01-01 00:00:00', 'M1');
+INSERT INTO transfers VALUES (1, 1, 'ORGANIZER', 'BOB', 0, 'X1', 'RESALE', 'CONFIRMED', '2025-01-01 00:00:00');
+INSERT INTO transfers VALUES (2, 1, 'BOB', 'BOB', 0, 'X1', 'RESALE', 'CONFIRMED', '2025-01-01 00:00:00');
+"""
+
+
+def _migration_log(caplog) -> list[str]:
+    return [record.getMessage() for record in caplog.records if record.name == "app.database"]
+
+
+def _indexes(db_path: Path) -> dict[str, str]:
+    with sqlite3.connect(db_path) as conn:
+        return dict(conn.execute("SELECT name, tbl_name FROM sqlite_master WHERE type = 'index'").fetchall())
+
+
+async def test_baseline_database_migrates_once(settings_env: Path, caplog):
+    with sqlite3.connect(settings_env) as conn:
+        conn.executescript(BASELINE_SCHEMA)
+
+    with caplog.at_level(logging.INFO, logger="app.database"):
+        await init_db()
+    assert "Migrated events.status to SMALLINT enum codes" in _migration_log(caplog)
+
+    with sqlite3.connect(settings_env) as conn:
+        # VARCHAR affinity keeps the rewritten codes as text; EnumCode reads them back with int()
+        active = list(EventStatus).index(EventStatus.ACTIVE)
+        assert conn.execute("SELECT status FROM events").fetchone() == (str(active),)
+        assert conn.execute("SELECT role FROM users").fetchone() == ("1",)
+        # The re-delivered duplicate of X1 is gone
+        assert conn.execute("SELECT id, transfer_type FROM transfers").fetchall() == [
+            (1, str(list(TransferType).index(TransferType.RESALE)))
+        ]
+        # Server-side defaults now fill in timestamps
+        conn.execute("INSERT INTO events (name, total_seats, max_resale_price, organizer_wallet, app_id, status) "
+                     "VALUES ('Later', 0, 0, 'ORGANIZER', 1, 0)")
+        assert conn.execute("SELECT created_at FROM events WHERE name = 'Later'").fetchone()[0] is not None
+
+    indexes = _indexes(settings_env)
+    assert {
+        "ix_tickets_event_status_id", "ix_tickets_status", "ix_transfers_ticket_id_id", "ix_transfers_txn_id"
+    } <= set(indexes)
+    # The inline UNIQUE already covers users.wallet_address
+    assert "ix_users_wallet_address" not in indexes
+
+    # A second startup finds nothing left to do
+    caplog.clear()
+    with caplog.at_level(logging.INFO, logger="app.database"):
+        await init_db()
+    assert _migration_log(caplog) == []
+    assert _indexes(settings_env) == indexes
+
+
+async def test_obsolete_indexes_are_replaced(settings_env: Path):
+    with sqlite3.connect(settings_env) as conn:
+        conn.executescript(BASELINE_SCHEMA)
+        conn.executescript("""
+            CREATE INDEX ix_events_created ON events (created_at);
+            CREATE UNIQUE INDEX ix_users_wallet_address ON users (wallet_address);
+            CREATE INDEX ix_tickets_event_status_minted ON tickets (event_id, status, minted_at);
+            CREATE INDEX ix_transfers_ticket_created ON transfers (ticket_id, created_at);
+        """)
+
+    await init_db()
+
+    indexes = _indexes(settings_env)
+    assert not {
+        "ix_events_created", "ix_users_wallet_address", "ix_tickets_event_status_minted", "ix_transfers_ticket_created"
+    } & set(indexes)
+    assert {"ix_tickets_event_status_id", "ix_transfers_ticket_id_id"} <= set(indexes)
+
+
+async def test_fresh_database_gets_declared_indexes(settings_env: Path):
+    await init_db()
+
+    assert "ix_users_wallet_address" in _indexes(settings_env)
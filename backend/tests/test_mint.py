@@ -0,0 +1,35 @@
+from fastapi.testclient import TestClient
+
+from app import algorand_service
+from app.main import app
+
+
+def _mint(client: TestClient, event_id: int, seat: str) -> dict:
+    response = client.post("/api/tickets/mint", json={"event_id": event_id, "seat_number": seat, "ticket_price": 100})
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def test_mint_batch_assigns_consecutive_asa_ids(client: TestClient, event_id: int):
+    response = client.post(
+        "/api/tickets/mint_batch",
+        json={"event_id": event_id, "tickets": [{"seat_number": f"B{i}", "ticket_price": 100} for i in range(3)]},
+    )
+    assert response.status_code == 201, response.text
+    assert [t["asa_id"] for t in response.json()] == [1, 2, 3]
+    assert [t["seat_number"] for t in response.json()] == ["B0", "B1", "B2"]
+
+
+def test_mint_after_restart_continues_asa_ids():
+    with TestClient(app) as client:
+        event_id = client.post(
+            "/api/events", json={"name": "Launch", "max_resale_price": 1_000, "organizer_wallet": "ORGANIZER"}
+        ).json()["id"]
+        first = _mint(client, event_id, "A1")
+
+    # A restart builds a fresh mock service, whose counter must resume above the stored IDs
+    algorand_service._service_for.cache_clear()
+    with TestClient(app) as client:
+        second = _mint(client, event_id, "A2")
+
+    assert second["asa_id"] == first["asa_id"] + 1
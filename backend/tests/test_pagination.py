@@ -0,0 +1,61 @@
+import pytest
+from fastapi.testclient import TestClient
+
+
+def _walk(client: TestClient, path: str, limit: int, **params) -> list[list[int]]:
+    """Follow after_id from the first page until an empty one; return the ids of each page."""
+    pages = []
+    after_id = None
+    for _ in range(100):
+        query = {**params, "limit": limit}
+        if after_id is not None:
+            query["after_id"] = after_id
+        response = client.get(path, params=query)
+        assert response.status_code == 200, response.text
+        ids = [row["id"] for row in response.json()]
+        if not ids:
+            return pages
+        pages.append(ids)
+        after_id = ids[-1]
+    pytest.fail(f"{path} did not reach an empty page")
+
+
+@pytest.fixture
+def ticket_ids(client: TestClient, event_id: int) -> list[int]:
+    ids = []
+    for chunk in range(0, 7, 4):
+        seats = [{"seat_number": f"S{i}", "ticket_price": 100} for i in range(chunk, min(chunk + 4, 7))]
+        response = client.post("/api/tickets/mint_batch", json={"event_id": event_id, "tickets": seats})
+        assert response.status_code == 201, response.text
+        ids += [t["id"] for t in response.json()]
+    return ids
+
+
+@pytest.mark.parametrize("limit", [1, 3, 7, 8])
+def test_ticket_pages_cover_every_row_once(client: TestClient, event_id: int, ticket_ids: list[int], limit: int):
+    pages = _walk(client, "/api/tickets", limit, event_id=event_id, status="minted")
+
+    assert [i for page in pages for i in page] == sorted(ticket_ids, reverse=True)
+    assert all(len(page) == limit for page in pages[:-1])
+    assert 0 < len(pages[-1]) <= limit
+
+
+def test_ticket_page_filters_apply_before_the_limit(client: TestClient, event_id: int, ticket_ids: list[int]):
+    assert _walk(client, "/api/tickets", 3, event_id=event_id, status="sold") == []
+    assert _walk(client, "/api/tickets", 3, event_id=event_id + 1) == []
+
+
+def test_event_pages_cover_every_row_once(client: TestClient):
+    ids = [
+        client.post(
+            "/api/events", json={"name": f"E{i}", "max_resale_price": 1, "organizer_wallet": "ORGANIZER"}
+        ).json()["id"]
+        for i in range(5)
+    ]
+
+    assert _walk(client, "/api/events", 2) == [ids[:2:-1], ids[2:0:-1], ids[:1]]
+
+
+def test_page_size_is_capped(client: TestClient):
+    assert client.get("/api/tickets", params={"limit": 501}).status_code == 422
+    assert client.get("/api/tickets", params={"limit": 0}).status_code == 422
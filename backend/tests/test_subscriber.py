@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+from sqlalchemy import func, insert, select, update
+
+from app.database import async_session
+from app.models import Event, SubscriberState, Ticket, TicketStatus, Transfer
+from app import subscriber as subscriber_module
+from app.subscriber import ChainSubscriber, MintRecord, TransferRecord
+
+APP_ID = 1
+
+BATCH = [
+    MintRecord(txn_id="M1", asa_id=501, seat_number="A1", ticket_price=100, sender="ORGANIZER"),
+    MintRecord(txn_id="M2", asa_id=502, seat_number="A2", ticket_price=100, sender="ORGANIZER"),
+    TransferRecord(txn_id="X1", asa_id=501, buyer="BOB", price=0),
+    TransferRecord(txn_id="X2", asa_id=501, buyer="CAROL", price=0),
+    TransferRecord(txn_id="X3", asa_id=502, buyer="DAVE", price=0),
+]
+
+
+def _subscriber() -> ChainSubscriber:
+    subscriber = ChainSubscriber()
+    subscriber.app_id = APP_ID
+    return subscriber
+
+
+async def _owners() -> dict[int, str]:
+    async with async_session() as session:
+        return dict((await session.execute(select(Ticket.asa_id, Ticket.current_owner_wallet))).all())
+
+
+async def _transfers() -> list[tuple[str, str, str]]:
+    async with async_session() as session:
+        return (await session.execute(
+            select(Transfer.txn_id, Transfer.from_wallet, Transfer.to_wallet).order_by(Transfer.id)
+        )).all()
+
+
+@pytest.fixture(autouse=True)
+async def event(db: None) -> None:
+    # _apply files synced mints under event 1
+    async with async_session() as session:
+        await session.execute(insert(Event).values(name="Synced", organizer_wallet="ORGANIZER", app_id=APP_ID))
+        await session.commit()
+
+
+async def test_apply_chains_transfers_in_order():
+    await _subscriber()._apply(BATCH, watermark=10)
+
+    assert await _owners() == {501: "CAROL", 502: "DAVE"}
+    assert await _transfers() == [("X1", "ORGANIZER", "BOB"), ("X2", "BOB", "CAROL"), ("X3", "ORGANIZER", "DAVE")]
+    async with async_session() as session:
+        assert await session.scalar(select(SubscriberState.watermark)) == 10
+
+
+@pytest.mark.parametrize("warm_cache", [True, False])
+async def test_apply_redelivery_is_idempotent(warm_cache: bool):
+    subscriber = _subscriber()
+    await subscriber._apply(BATCH, watermark=10)
+    before = await _transfers()
+
+    # Same batch again, from the same subscriber or from a fresh one with a cold cache
+    await (subscriber if warm_cache else _subscriber())._apply(BATCH, watermark=10)
+
+    assert await _transfers() == before
+    assert await _owners() == {501: "CAROL", 502: "DAVE"}
+    async with async_session() as session:
+        assert await session.scalar(select(func.count()).select_from(Ticket)) == 2
+
+
+async def test_redelivered_transfer_leaves_a_newer_owner_alone():
+    await _subscriber()._apply(BATCH, watermark=10)
+    async with async_session() as session:
+        await session.execute(update(Ticket).where(Ticket.asa_id == 501).values(current_owner_wallet="ERIN"))
+        await session.commit()
+
+    # One old transfer for 501 and one new one for 502, duplicated within the batch
+    new = TransferRecord(txn_id="X4", asa_id=502, buyer="FRED", price=0)
+    await _subscriber()._apply([BATCH[3], new, new], watermark=11)
+
+    assert await _owners() == {501: "ERIN", 502: "FRED"}
+    assert (await _transfers())[3:] == [("X4", "DAVE", "FRED")]
+    async with async_session() as session:
+        assert await session.scalar(select(Ticket.status).where(Ticket.asa_id == 502)) == TicketStatus.TRANSFERRED
+
+
+async def test_rejected_record_is_skipped_and_the_rest_commit():
+    # seat_number is NOT NULL, so the database rejects this mint and the batch falls back to one row at a time
+    bad = MintRecord(txn_id="M3", asa_id=503, seat_number=None, ticket_price=100, sender="ORGANIZER")
+    orphan = TransferRecord(txn_id="X5", asa_id=503, buyer="ERIN", price=0)
+    await _subscriber()._apply([*BATCH[:2], bad, *BATCH[2:], orphan], watermark=10)
+
+    assert await _owners() == {501: "CAROL", 502: "DAVE"}
+    assert await _transfers() == [("X1", "ORGANIZER", "BOB"), ("X2", "BOB", "CAROL"), ("X3", "ORGANIZER", "DAVE")]
+    async with async_session() as session:
+        assert await session.scalar(select(SubscriberState.watermark)) == 10
+
+
+async def test_out_of_process_wait_ignores_empty_polls(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(subscriber_module, "HIGH_WATER_POLL_INTERVAL", 0.01)
+    syncer, waiter = _subscriber(), ChainSubscriber()
+
+    # A poll that found nothing still advances the watermark
+    wait = asyncio.create_task(waiter.wait_for_change(timeout=0.2))
+    await syncer._apply([], watermark=10)
+    assert await wait is False
+
+    wait = asyncio.create_task(waiter.wait_for_change(timeout=5))
+    await asyncio.sleep(0.05)
+    await syncer._apply(BATCH[:1], watermark=11)
+    assert await wait is True
@@ -28,27 +28,30 @@ def main() -> None:
     print(f"Alice:     {alice.address}")
     print(f"Bob:       {bob.address}\n")
 
-    # 4. Fund Alice with exactly 100 Algos (100_000_000 microAlgos)
-    algorand.send.payment(
-        PaymentParams(
-            sender=dispenser.address,
-            receiver=alice.address,
-            amount=AlgoAmount.from_micro_algo(100_000_000),  # 100 ALGO
+    # 4. Fund Alice and Bob with exactly 100 Algos each (100_000_000 microAlgos)
+    #    in one atomic group — a single submit and a single block wait
+    (
+        algorand.new_group()
+        .add_payment(
+            PaymentParams(
+                sender=dispenser.address,
+                receiver=alice.address,
+                amount=AlgoAmount.from_micro_algo(100_000_000),  # 100 ALGO
+            )
         )
-    )
-    print("✅ Alice funded with 100 ALGO")
-
-    # 5. Fund Bob with exactly 100 Algos
-    algorand.send.payment(
-        PaymentParams(
-            sender=dispenser.address,
-            receiver=bob.address,
-            amount=AlgoAmount.from_micro_algo(100_000_000),  # 100 ALGO
+        .add_payment(
+            PaymentParams(
+                sender=dispenser.address,
+                receiver=bob.address,
+                amount=AlgoAmount.from_micro_algo(100_000_000),  # 100 ALGO
+            )
         )
+        .send()
     )
+    print("✅ Alice funded with 100 ALGO")
     print("✅ Bob funded with 100 ALGO")
 
-    # 6. Verify balances
+    # 5. Verify balances
     alice_info = algorand.client.algod.account_info(alice.address)
     bob_info = algorand.client.algod.account_info(bob.address)
 
@@ -105,6 +105,7 @@ def build(output_dir: Path, contract_path: Path) -> Path:
             "python",
             str(contract_path.resolve()),
             f"--out-dir={output_dir}",
+            "--optimization-level=2",
             "--no-output-arc32",
             "--output-arc56",
             "--output-source-map",
@@ -1,28 +1,28 @@
-from algopy import ARC4Contract, String, UInt64, Asset, Global, itxn, gtxn, arc4, Txn
+from algopy import ARC4Contract, BoxMap, String, UInt64, Asset, Global, itxn, gtxn, arc4, Txn
 
 class EventTicketing(ARC4Contract):
-    max_resale_price: UInt64
+    def __init__(self) -> None:
+        # max resale price per ticket, keyed by ASA id
+        self.prices = BoxMap(UInt64, UInt64, key_prefix=b"p")
 
     @arc4.abimethod
     def mint_ticket(self, ticket_price: UInt64, seat_number: String) -> Asset:
-        self.max_resale_price = ticket_price
-        
-        return itxn.AssetConfig(
+        asset = itxn.AssetConfig(
             total=1,
             decimals=0,
             default_frozen=False,
             unit_name="TICKET",
             asset_name=seat_number,
             manager=Global.current_application_address,
-            reserve=Global.current_application_address,
-            freeze=Global.current_application_address,
-            clawback=Global.current_application_address,
         ).submit().created_asset
+        self.prices[asset.id] = ticket_price
+
+        return asset
 
     @arc4.abimethod
     def transfer_ticket(self, payment: gtxn.PaymentTransaction, asset: Asset) -> None:
-        assert payment.amount <= self.max_resale_price, "Price exceeds max resale price"
         assert payment.receiver == Global.current_application_address, "Payment must be to the contract"
+        assert payment.amount <= self.prices[asset.id], "Price exceeds max resale price"
         
         itxn.AssetTransfer(
             xfer_asset=asset,
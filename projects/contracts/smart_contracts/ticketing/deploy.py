@@ -1,6 +1,7 @@
 from algokit_utils import (
     AlgorandClient,
-    AlgoAmount
+    AlgoAmount,
+    CommonAppCallParams,
 )
 from smart_contracts.artifacts.ticketing.event_ticketing_client import (
     EventTicketingFactory,
@@ -38,20 +39,21 @@ def deploy():
     )
     print("App account funded with 10 ALGO")
 
-    # 6. Mint 5 VIP tickets
+    # 6. Mint 5 VIP tickets in one atomic group (one submit, one block wait)
     valid_ticket_price = 100 # Example price
-    
-    for i in range(1, 6):
-        seat_num = f"VIP-{i}"
-        
-        # Call mint_ticket method
-        # Returns SendAppTransactionResult[int] where generic type is the return value
-        result = app_client.send.mint_ticket(
-            args=(valid_ticket_price, seat_num)
-        )
-        
-        created_asset_id = result.abi_return
-        print(f"Minted Ticket {i} (Seat: {seat_num}): Asset ID {created_asset_id}")
+    seats = [f"VIP-{i}" for i in range(1, 6)]
+
+    # Each call pays for its inner AssetConfig txn; fees pool across the group
+    mint_params = CommonAppCallParams(extra_fee=AlgoAmount.from_micro_algo(1_000))
+
+    group = app_client.new_group()
+    for seat_num in seats:
+        group.mint_ticket(args=(valid_ticket_price, seat_num), params=mint_params)
+    result = group.send()
+
+    # One ABI return per call, in the order they were added
+    for i, (seat_num, abi_return) in enumerate(zip(seats, result.returns, strict=True), start=1):
+        print(f"Minted Ticket {i} (Seat: {seat_num}): Asset ID {abi_return.value}")
 
     print("Deployment and minting complete!")
 
@@ -8,6 +8,7 @@ Usage:
 """
 
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -98,13 +99,13 @@ def deploy() -> None:
     env_path = Path(__file__).parent.parent.parent / ".env"
     env_content = env_path.read_text() if env_path.exists() else ""
 
-    # Update or add APP_ID
+    # Update or add APP_ID — one regex pass rewrites every existing key
     updates = {"APP_ID": str(app_id), "VITE_APP_ID": str(app_id)}
+    pattern = re.compile(rf"^({'|'.join(map(re.escape, updates))})=.*$", re.MULTILINE)
+    found = set(pattern.findall(env_content))
+    env_content = pattern.sub(lambda m: f"{m.group(1)}={updates[m.group(1)]}", env_content)
     for key, value in updates.items():
-        if f"{key}=" in env_content:
-            import re
-            env_content = re.sub(rf"^{key}=.*$", f"{key}={value}", env_content, flags=re.MULTILINE)
-        else:
+        if key not in found:
             env_content += f"\n{key}={value}\n"
 
     env_path.write_text(env_content)
@@ -1,6 +1,21 @@
+import io
+import os
+import urllib.error
+import urllib.request
+from collections.abc import Callable, Iterator
+
 import pytest
-from algokit_utils import AlgorandClient
+import requests
+from algokit_utils import AlgoAmount, AlgorandClient, AssetOptOutParams, SigningAccount
 from algokit_utils.config import config
+from algosdk.v2client import algod
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from smart_contracts.artifacts.ticketing.event_ticketing_client import (
+    EventTicketingClient,
+    EventTicketingFactory,
+)
 
 # Uncomment if you want to load network specific or generic .env file
 # @pytest.fixture(autouse=True, scope="session")
@@ -14,7 +29,119 @@ config.configure(
 )
 
 
+class _SessionResponse(io.BytesIO):
+    """The slice of http.client.HTTPResponse that AlgodClient.algod_request reads."""
+
+    def __init__(self, resp: requests.Response) -> None:
+        super().__init__(resp.content)
+        self.status = resp.status_code
+        self.length = len(resp.content)
+
+
+def _session_urlopen(session: requests.Session) -> Callable[..., _SessionResponse]:
+    """A drop-in for urllib's urlopen that sends algod requests over one keep-alive session."""
+
+    def urlopen(req: urllib.request.Request, timeout: float | None = None) -> _SessionResponse:
+        resp = session.request(
+            req.get_method(), req.full_url, data=req.data, headers=dict(req.header_items()), timeout=timeout
+        )
+        if not resp.ok:
+            # raised like urllib does, so the SDK's own AlgodHTTPError mapping still applies
+            raise urllib.error.HTTPError(
+                req.full_url, resp.status_code, resp.reason, resp.headers, io.BytesIO(resp.content)
+            )
+        return _SessionResponse(resp)
+
+    return urlopen
+
+
+@pytest.fixture(autouse=True, scope="session")
+def pooled_algod_session() -> Iterator[None]:
+    # AlgodClient opens a fresh urllib connection per call; route it through a pooled requests.Session instead.
+    # urllib3 only retries POSTs that never reached algod, so a submitted txn is never sent twice.
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=Retry(total=3))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(algod, "urlopen", _session_urlopen(session))
+        yield
+    session.close()
+
+
 @pytest.fixture(scope="session")
 def algorand_client() -> AlgorandClient:
     # by default we are using localnet algod
     return AlgorandClient.from_environment()
+
+
+def _account_name(name: str) -> str:
+    # under pytest-xdist each worker gets its own KMD wallets (and so its own app deployment)
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    return f"{name}_{worker.upper()}" if worker else name
+
+
+def _buyer(algorand_client: AlgorandClient, name: str) -> SigningAccount:
+    # On LocalNet this resolves to a named KMD wallet, reused across runs. from_environment only funds
+    # it when the wallet is first created, so top it up here; that is a no-op while it has enough.
+    account = algorand_client.account.from_environment(_account_name(name))
+    algorand_client.account.ensure_funded_from_environment(account, min_spending_balance=AlgoAmount.from_algo(10))
+    return account
+
+
+@pytest.fixture(scope="session")
+def scalper(algorand_client: AlgorandClient) -> SigningAccount:
+    return _buyer(algorand_client, "SCALPER")
+
+
+@pytest.fixture(scope="session")
+def fan(algorand_client: AlgorandClient) -> SigningAccount:
+    return _buyer(algorand_client, "FAN")
+
+
+@pytest.fixture(scope="session")
+def app_client(algorand_client: AlgorandClient) -> EventTicketingClient:
+    """Deploy the contract once per session and return the client."""
+    creator = algorand_client.account.from_environment(_account_name("CREATOR"), fund_with=AlgoAmount.from_algo(1000))
+
+    factory = algorand_client.client.get_typed_app_factory(
+        EventTicketingFactory,
+        default_sender=creator.address
+    )
+
+    # an unchanged app is reused as is, so repeat runs skip the redeploy
+    client, _ = factory.deploy(
+        on_schema_break="append",
+        on_update="append",
+    )
+
+    # Fund the app account for inner transactions (opt-ins, etc.) unless a previous run left enough spendable;
+    # every minted ASA and price box raises the app's min balance, so compare what is above it
+    app_info = algorand_client.client.algod.account_info(client.app_address)
+    if app_info["amount"] - app_info["min-balance"] < AlgoAmount.from_algo(1).micro_algo:
+        algorand_client.send.payment(
+            sender=creator.address,
+            receiver=client.app_address,
+            amount=AlgoAmount.from_algo(1)
+        )
+
+    return client
+
+
+@pytest.fixture
+def ticket_holdings(
+    algorand_client: AlgorandClient, app_client: EventTicketingClient
+) -> Iterator[list[tuple[SigningAccount, int]]]:
+    """
+    (account, ticket asset id) pairs a test opted into. Each is closed back to the app afterwards,
+    so the reused session accounts don't pile up opt-ins and their locked min balance.
+    """
+    holdings: list[tuple[SigningAccount, int]] = []
+    yield holdings
+    for account, asset_id in holdings:
+        algorand_client.send.asset_opt_out(
+            AssetOptOutParams(
+                sender=account.address, signer=account.signer, asset_id=asset_id, creator=app_client.app_address
+            ),
+            ensure_zero_balance=False,
+        )
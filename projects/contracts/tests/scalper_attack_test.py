@@ -1,116 +1,81 @@
-import pytest
 import algokit_utils
+import pytest
 from algokit_utils import (
-    AlgorandClient,
-    OnSchemaBreak,
-    OnUpdate,
     AlgoAmount,
-    TransactionParameters,
-)
-from algosdk.atomic_transaction_composer import TransactionWithSigner
-from algosdk.transaction import PaymentTxn
-from smart_contracts.artifacts.ticketing.event_ticketing_client import (
-    EventTicketingFactory,
-    EventTicketingClient,
+    AlgorandClient,
+    SigningAccount,
 )
 
-@pytest.fixture(scope="module")
-def app_client(algorand_client: AlgorandClient) -> EventTicketingClient:
-    """Deploy the contract and return the client."""
-    creator = algorand_client.account.from_environment("CREATOR", fund_with=AlgoAmount.from_algo(1000))
-    
-    factory = algorand_client.client.get_typed_app_factory(
-        EventTicketingFactory, 
-        default_sender=creator.address
-    )
-    
-    client, _ = factory.deploy(
-        on_schema_break="append",
-        on_update="append",
+from smart_contracts.artifacts.ticketing.event_ticketing_client import EventTicketingClient
+
+# Each app call pays for its one inner transaction, which the contract submits with Fee = 0
+INNER_FEE = AlgoAmount.from_micro_algo(1_000)
+
+
+def _buy(
+    algorand_client: AlgorandClient,
+    app_client: EventTicketingClient,
+    buyer: SigningAccount,
+    asset_id: int,
+    amount: int,
+) -> None:
+    """Opt in, pay `amount` microAlgos and claim the ticket as one atomic group."""
+    payment = algorand_client.create_transaction.payment(
+        algokit_utils.PaymentParams(
+            sender=buyer.address,
+            receiver=app_client.app_address,
+            amount=AlgoAmount.from_micro_algo(amount),
+        )
     )
-    
-    # Fund the app account for inner transactions (opt-ins, etc.)
-    algorand_client.send.payment(
-        sender=creator.address,
-        receiver=client.app_address,
-        amount=AlgoAmount.from_algo(1)
+    (
+        algorand_client.new_group()
+        .add_asset_opt_in(
+            algokit_utils.AssetOptInParams(sender=buyer.address, signer=buyer.signer, asset_id=asset_id)
+        )
+        .add_app_call_method_call(
+            app_client.params.transfer_ticket(
+                args=(payment, asset_id),
+                params=algokit_utils.CommonAppCallParams(
+                    sender=buyer.address, signer=buyer.signer, extra_fee=INNER_FEE
+                ),
+            )
+        )
+        .send()
     )
-    
-    return client
 
-def test_scalper_attack(app_client: EventTicketingClient, algorand_client: AlgorandClient):
+
+@pytest.mark.parametrize(
+    ("mint_price", "pay", "fails"),
+    [(100, 500, True), (100, 100, False), (100, 101, True), (1_000_000, 999_999, False)],
+)
+def test_price_boundary(
+    app_client: EventTicketingClient,
+    algorand_client: AlgorandClient,
+    scalper: SigningAccount,
+    fan: SigningAccount,
+    ticket_holdings: list[tuple[SigningAccount, int]],
+    mint_price: int,
+    pay: int,
+    *,
+    fails: bool,
+):
     """
-    Test that the contract rejects a transfer with a price higher than max_resale_price.
+    Test that the contract rejects a transfer paying more than the ticket's max resale price,
+    and that a rejected scalper leaves the ticket available to a fan paying within the cap.
+    Every case mints its own ticket on the shared session deployment.
     """
-    # 1. Mint a ticket with a price of 100 microAlgos
-    ticket_price = 100
-    seat_number = "VIP-1"
-    
-    mint_result = app_client.send.mint_ticket(
-        args=(ticket_price, seat_number)
-    )
-    asset_id = mint_result.abi_return
-    
-    print(f"Minted asset {asset_id} with max resale price {ticket_price}")
+    asset_id = app_client.send.mint_ticket(
+        args=(mint_price, f"P-{mint_price}-{pay}"),
+        params=algokit_utils.CommonAppCallParams(extra_fee=INNER_FEE),
+    ).abi_return
 
-    scalper = algorand_client.account.from_environment("SCALPER", fund_with=AlgoAmount.from_algo(100))
-    fan = algorand_client.account.from_environment("FAN", fund_with=AlgoAmount.from_algo(100))
-    
-    # Opt-in to asset
-    algorand_client.send.asset_opt_in(
-        sender=scalper.address,
-        asset_id=asset_id,
-        signer=scalper.signer
-    )
-    algorand_client.send.asset_opt_in(
-        sender=fan.address,
-        asset_id=asset_id,
-        signer=fan.signer
-    )
+    if fails:
+        # Opt-in, payment and purchase go out as one group; expect the whole group to fail
+        with pytest.raises(Exception, match="Price exceeds max resale price"):
+            _buy(algorand_client, app_client, scalper, asset_id, pay)
+        pay = mint_price
 
-    # SCENARIO 1: Scalper tries to buy/claim the ticket paying MORE than max_price
-    print("Scalper trying to buy for 500 (limit 100)...")
-    
-    # Construct payment transaction
-    sp = app_client.algorand.client.algod.suggested_params()
-    payment_scalper = PaymentTxn(
-        sender=scalper.address,
-        sp=sp,
-        receiver=app_client.app_address,
-        # 500% of price
-        amt=500
-    )
-    
-    # Expect failure
-    with pytest.raises(Exception, match="Price exceeds max resale price"):
-        app_client.send.transfer_ticket(
-            args=(
-                TransactionWithSigner(payment_scalper, scalper.signer),
-                asset_id
-            ),
-            send_params={"sender": scalper.address, "signer": scalper.signer}
-        )
-    print("Scalper attack REJECTED as expected!")
-
-    # SCENARIO 2: Fan buys at face value
-    print("Fan buying for 100...")
-    payment_fan = PaymentTxn(
-        sender=fan.address,
-        sp=sp,
-        receiver=app_client.app_address,
-        amt=100
-    )
-    
-    app_client.send.transfer_ticket(
-        args=(
-            TransactionWithSigner(payment_fan, fan.signer),
-            asset_id
-        ),
-        send_params={"sender": fan.address, "signer": fan.signer}
-    )
-    print("Fan purchase ACCEPTED!")
-    
-    # Verify ownership
-    account_info = app_client.algorand.client.algod.account_asset_info(fan.address, asset_id)
-    assert account_info['asset-holding']['amount'] == 1
-    print("Fan owns the ticket.")
+    _buy(algorand_client, app_client, fan, asset_id, pay)
+    ticket_holdings.append((fan, asset_id))
+    account_info = algorand_client.client.algod.account_asset_info(fan.address, asset_id)
+    assert account_info["asset-holding"]["amount"] == 1